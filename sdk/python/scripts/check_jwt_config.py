@@ -114,7 +114,7 @@ def main():
         print()
         print("You can test without a JWT token:")
         print("  export DORC_MCP_URL=\"https://your-service.run.app\"")
-        print("  python test_integration_standalone.py")
+        print("  pytest tests/test_integration.py -v")
         return 0
     
     if jwt_secret:
@@ -184,7 +184,7 @@ Examples:
     print(f'  export DORC_JWT="{token}"')
     print()
     print("  # Or use it directly:")
-    print(f'  python test_integration_standalone.py')
+    print(f'  pytest tests/test_integration.py -v')
     print()
     print("  # Or with curl:")
     print(f'  curl -H "Authorization: Bearer {token}" \\')
@@ -1,17 +1,56 @@
-from .client import DorcClient
-from .config import Config
-from .errors import DorcAuthError, DorcClientError, DorcConfigError, DorcError, DorcHttpError
-from .version import __version__
-
-__all__ = [
-    "__version__",
-    "Config",
-    "DorcClient",
-    "DorcAuthError",
-    "DorcClientError",
-    "DorcConfigError",
-    "DorcError",
-    "DorcHttpError",
-]
-
-
+"""dorc-client public API.
+
+Submodules are imported lazily (PEP 562) so that lightweight entry points
+(``from dorc_client import Config``, CLI --help) do not pay the httpx +
+pydantic import cost unless a client class is actually touched.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .async_client import AsyncDorcClient
+    from .client import DorcClient, get_default_client
+    from .config import Config
+    from .errors import DorcAuthError, DorcClientError, DorcConfigError, DorcError, DorcHttpError
+    from .version import __version__
+
+__all__ = [
+    "__version__",
+    "AsyncDorcClient",
+    "Config",
+    "DorcClient",
+    "DorcAuthError",
+    "DorcClientError",
+    "DorcConfigError",
+    "DorcError",
+    "DorcHttpError",
+    "get_default_client",
+]
+
+_LAZY_ATTRS = {
+    "__version__": "version",
+    "AsyncDorcClient": "async_client",
+    "Config": "config",
+    "DorcClient": "client",
+    "DorcAuthError": "errors",
+    "DorcClientError": "errors",
+    "DorcConfigError": "errors",
+    "DorcError": "errors",
+    "DorcHttpError": "errors",
+    "get_default_client": "client",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache so __getattr__ runs once per symbol
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
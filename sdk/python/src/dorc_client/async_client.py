@@ -0,0 +1,447 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import random
+import time
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+import httpx
+
+from .auth import api_key_headers, bearer_headers
+from .client import (
+    _BASE_HEADERS,
+    _JSON_HEADERS,
+    _LIMITS,
+    _SDK_ACTOR,
+    _VALIDATE_URL,
+    _chunks_url,
+    _is_transient_response,
+    _jwt_exp,
+    _loads,
+    _map_legacy_validate_args,
+    _parse_response,
+    _retry_get,
+    _run_url,
+    _validate_payload,
+    _validated_tenant,
+)
+from .config import Config
+from .errors import DorcAuthError, DorcError
+from .models import (
+    ChunkResult,
+    ChunkResultsResponse,
+    RunStateResponse,
+    ValidateResponse,
+)
+
+
+class AsyncDorcClient:
+    """Async variant of :class:`dorc_client.DorcClient` built on httpx.AsyncClient.
+
+    Mirrors the sync client's API (``validate``, ``get_run``, ``list_chunks``,
+    ``health``, ``healthz``) as coroutines, and adds ``validate_many`` for
+    fanning out independent validations concurrently. Independent requests
+    share one connection pool, so N validations complete in roughly the
+    latency of the slowest one instead of the sum.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str | None = None,
+        token: str | None = None,
+        timeout_s: float = 30.0,
+        validate_timeout_s: float = 300.0,
+        config: Config | None = None,
+        request_id: str | None = None,
+        http2: bool = False,
+    ):
+        if config is None:
+            if base_url is None and token is None:
+                config = Config.from_env()
+            else:
+                # MCP mode: token is a Bearer token (API key or JWT)
+                config = Config(
+                    base_url=(base_url or "").rstrip("/"),
+                    mode="mcp",
+                    token=token,
+                )
+
+        self.config = config
+        self._default_request_id = (
+            (request_id or os.getenv("DORC_REQUEST_ID") or "").strip() or None
+        )
+        # Engine auth never changes over the client's life; precompute an
+        # immutable view once so the hot path skips a dict build per request.
+        self._engine_auth: Mapping[str, str] | None = (
+            MappingProxyType(api_key_headers(self.config.api_key))
+            if self.config.mode == "engine"
+            else None
+        )
+        self._timeout = httpx.Timeout(timeout_s)
+        self._validate_timeout = httpx.Timeout(validate_timeout_s)
+        # http2=True requires the optional `h2` package (pip install dorc-client[http2]).
+        self._client = httpx.AsyncClient(
+            base_url=self.config.base_url,
+            headers=_BASE_HEADERS,  # auth headers stay per-request
+            transport=httpx.AsyncHTTPTransport(retries=1, http2=http2, limits=_LIMITS),
+        )
+        # Health endpoint that last answered 2xx; probe_health re-probes both
+        # only when this one stops responding.
+        self._health_path: str | None = None
+
+    def _require_token(self) -> str:
+        """Get Bearer token, raising clear error if missing."""
+        if self.config.mode != "mcp":
+            raise DorcError(
+                status_code=500,
+                code="CONFIG_ERROR",
+                message="Token is only required in MCP mode",
+            )
+        token = (self.config.token or "").strip() or None
+        if not token:
+            raise DorcAuthError(
+                status_code=401,
+                code="UNAUTHENTICATED",
+                message=(
+                    "Bearer token is required. "
+                    "Set token parameter or DORC_TOKEN environment variable."
+                ),
+            )
+        # Fail fast on a visibly expired JWT (30s margin) instead of paying a
+        # guaranteed 401 round-trip; opaque tokens (no exp) pass through.
+        exp = _jwt_exp(token)
+        if exp is not None and time.time() >= exp - 30.0:
+            raise DorcAuthError(
+                status_code=401,
+                code="UNAUTHENTICATED",
+                message="Bearer token is expired (or expires within 30s); refresh the JWT.",
+            )
+        return token
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncDorcClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    @classmethod
+    def for_mcp(
+        cls,
+        base_url: str,
+        *,
+        token: str,
+        timeout_s: float = 30.0,
+        validate_timeout_s: float = 300.0,
+    ) -> AsyncDorcClient:
+        """Create async client for MCP mode with Bearer token."""
+        cfg = Config(
+            base_url=base_url.rstrip("/"),
+            mode="mcp",
+            token=token.strip() if token else None,
+        )
+        return cls(
+            config=cfg,
+            timeout_s=timeout_s,
+            validate_timeout_s=validate_timeout_s,
+        )
+
+    @classmethod
+    def for_engine(
+        cls,
+        base_url: str,
+        *,
+        api_key: str,
+        tenant_slug: str,
+        timeout_s: float = 30.0,
+        validate_timeout_s: float = 300.0,
+    ) -> AsyncDorcClient:
+        cfg = Config(
+            base_url=base_url.rstrip("/"),
+            mode="engine",
+            tenant_slug=_validated_tenant(tenant_slug),
+            api_key=api_key,
+        )
+        return cls(config=cfg, timeout_s=timeout_s, validate_timeout_s=validate_timeout_s)
+
+    def _auth_headers(
+        self, require_auth: bool = True, request_id: str | None = None
+    ) -> Mapping[str, str]:
+        """Get auth headers. require_auth=False for health endpoints.
+
+        May return a shared read-only mapping (httpx accepts any Mapping);
+        callers that add headers must copy rather than mutate.
+        """
+        req_id = (request_id or self._default_request_id or "").strip() or None
+        if require_auth and req_id is None:
+            # Hot path (polling): headers are fully determined by config, so
+            # return the precomputed/memoized mapping - no dict per request.
+            if self._engine_auth is not None:
+                return self._engine_auth
+            if self.config.mode == "mcp":
+                return bearer_headers(self._require_token())
+        headers: dict[str, str] = {}
+        if req_id:
+            headers["X-Request-Id"] = req_id
+        if not require_auth:
+            return headers
+        if self.config.mode == "mcp":
+            token = self._require_token()
+            headers.update(bearer_headers(token))
+            return headers
+        # engine-direct (legacy) - not part of contract but kept for compatibility
+        headers.update(api_key_headers(self.config.api_key))
+        return headers
+
+    def _raise_for_status(self, resp: httpx.Response) -> None:
+        if 200 <= resp.status_code < 300:
+            return
+
+        # Empty bodies (204s, LB-generated errors) skip all decode work.
+        has_body = bool(resp.content)
+        text: str | None = None
+        if has_body:
+            try:
+                text = resp.text
+            except Exception:
+                text = None
+
+        # Prefer contract error envelope; only attempt the parse when the
+        # server actually claims to be sending JSON.
+        code = "HTTP_ERROR"
+        message = "request failed"
+        request_id = None
+        if has_body and resp.headers.get("content-type", "").startswith("application/json"):
+            try:
+                payload = _loads(resp.content)
+                if isinstance(payload, dict) and isinstance(payload.get("error"), dict):
+                    err = payload["error"]
+                    code = str(err.get("code") or code)
+                    message = str(err.get("message") or message)
+                    request_id = str(err.get("request_id")) if err.get("request_id") else None
+            except Exception:
+                pass
+
+        if resp.status_code in (401, 403):
+            raise DorcAuthError(
+                resp.status_code,
+                code=code,
+                message=message,
+                request_id=request_id,
+                response_text=text,
+            )
+
+        raise DorcError(
+            resp.status_code,
+            code=code,
+            message=message,
+            request_id=request_id,
+            response_text=text,
+        )
+
+    @_retry_get()
+    async def _get(self, url: str | httpx.URL) -> httpx.Response:
+        resp = await self._client.get(
+            url, timeout=self._timeout, headers=self._auth_headers()
+        )
+        if _is_transient_response(resp):
+            return resp
+        self._raise_for_status(resp)
+        return resp
+
+    async def health(self) -> dict[str, Any]:
+        """GET /health - Returns health status (no auth required)."""
+        r = await self._client.get(
+            "/health",
+            timeout=self._timeout,
+            headers=self._auth_headers(require_auth=False),
+        )
+        self._raise_for_status(r)
+        return r.json()
+
+    async def healthz(self) -> dict[str, Any]:
+        """GET /healthz - Returns health status (no auth required)."""
+        r = await self._client.get(
+            "/healthz",
+            timeout=self._timeout,
+            headers=self._auth_headers(require_auth=False),
+        )
+        self._raise_for_status(r)
+        return r.json()
+
+    async def probe_health(self) -> bool:
+        """Probe /healthz and /health concurrently; True as soon as either is 2xx.
+
+        Issues both GETs at once and resolves on the first 2xx, so a slow
+        failure on one endpoint does not delay the other's answer. The
+        winning path is remembered, so repeated probes amortize to a single
+        request until that path stops answering.
+        """
+
+        async def _probe(path: str) -> bool:
+            r = await self._client.get(
+                path,
+                timeout=self._timeout,
+                headers=self._auth_headers(require_auth=False),
+            )
+            return 200 <= r.status_code < 300
+
+        if self._health_path is not None:
+            try:
+                if await _probe(self._health_path):
+                    return True
+            except httpx.HTTPError:
+                pass
+            # Cached path went dark; fall through and re-probe both.
+            self._health_path = None
+
+        tasks = {asyncio.ensure_future(_probe(p)): p for p in ("/healthz", "/health")}
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    try:
+                        if task.result():
+                            self._health_path = tasks[task]
+                            return True
+                    except httpx.HTTPError:
+                        continue
+            return False
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def validate(
+        self,
+        *,
+        candidate_content: str | None = None,
+        content_type: str = "text/markdown",
+        mode: str = "audit",
+        title: str | None = None,
+        metadata: dict[str, str] | None = None,
+        options: dict[str, Any] | None = None,
+        request_id: str | None = None,
+        # legacy args (deprecated)
+        content: str | None = None,
+        candidate_text: str | None = None,
+        candidate_id: str | None = None,
+        candidate_title: str | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> ValidateResponse:
+        """POST /v1/validate (contract-native).
+
+        In MCP mode, tenant is derived by MCP from the JWT.
+        In engine-direct mode, tenant is required.
+        """
+        # Deprecation adapter: old callers used content=/candidate_text=
+        # and candidate_id/title/context (mapped out of line, see
+        # _map_legacy_validate_args).
+        if candidate_content is None and (content is not None or candidate_text is not None):
+            candidate_content, title, metadata = _map_legacy_validate_args(
+                content, candidate_text, title, candidate_title, metadata, context, stacklevel=3
+            )
+
+        if candidate_content is None or not str(candidate_content).strip():
+            raise ValueError("validate() requires candidate_content=... (non-empty)")
+
+        if request_id is None:
+            request_id = self._default_request_id
+
+        # Engine-direct requires tenant_slug; MCP must not include it.
+        extra: dict[str, Any] = {}
+        if self.config.mode == "engine":
+            if not (self.config.tenant_slug or "").strip():
+                raise ValueError("tenant_slug is required for engine-direct client")
+            tenant = _validated_tenant(self.config.tenant_slug)
+            extra = {"tenant_slug": tenant, "actor": _SDK_ACTOR}
+
+        # One pass: build the wire dict and serialize it once (same shape as
+        # the sync client's _post_validate).
+        payload = _validate_payload(
+            candidate_content=candidate_content,
+            content_type=content_type,
+            mode=mode,
+            title=title,
+            metadata=metadata,
+            options=options,
+            request_id=request_id,
+            candidate_id=candidate_id,
+            extra=extra,
+        )
+        # Copy: _auth_headers may hand back a shared read-only mapping.
+        headers = {**self._auth_headers(require_auth=True, request_id=request_id), **_JSON_HEADERS}
+        resp = await self._client.post(
+            _VALIDATE_URL,
+            content=json.dumps(payload, separators=(",", ":")),
+            timeout=self._validate_timeout,
+            headers=headers,
+        )
+        self._raise_for_status(resp)
+        return ValidateResponse.model_validate_json(resp.content)
+
+    async def validate_many(
+        self,
+        items: list[dict[str, Any]],
+        *,
+        concurrency: int = 10,
+    ) -> list[ValidateResponse]:
+        """Validate many candidates concurrently.
+
+        Each item is a dict of keyword arguments for :meth:`validate`
+        (e.g. ``{"candidate_content": "..."}``). At most ``concurrency``
+        requests are in flight at once; results are returned in input order.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(item: dict[str, Any]) -> ValidateResponse:
+            async with sem:
+                return await self.validate(**item)
+
+        return list(await asyncio.gather(*(_one(item) for item in items)))
+
+    async def get_run(self, run_id: str) -> RunStateResponse:
+        resp = await self._get(_run_url(run_id))
+        return _parse_response(RunStateResponse, resp.content)
+
+    async def list_chunks(self, run_id: str) -> list[ChunkResult]:
+        resp = await self._get(_chunks_url(run_id))
+        return _parse_response(ChunkResultsResponse, resp.content).chunks
+
+    async def wait_for_completion(
+        self,
+        run_id: str,
+        *,
+        poll_interval_s: float = 2.0,
+        max_poll_interval_s: float = 15.0,
+        timeout_s: float = 60.0,
+    ) -> RunStateResponse:
+        """Poll /v1/runs/{run_id} until pipeline_status != RUNNING (best-effort helper).
+
+        Polls with exponential backoff capped at ``max_poll_interval_s`` plus
+        +/-20% jitter, matching the sync client's polling profile.
+        """
+        deadline = time.time() + timeout_s
+        attempt = 0
+        while True:
+            r = await self.get_run(run_id)
+            if str(r.pipeline_status).upper() != "RUNNING":
+                return r
+            if time.time() >= deadline:
+                raise TimeoutError(f"timeout waiting for run {run_id}")
+            interval = min(poll_interval_s * 1.5**attempt, max_poll_interval_s)
+            interval *= random.uniform(0.8, 1.2)
+            await asyncio.sleep(min(interval, max(deadline - time.time(), 0.0)))
+            attempt += 1
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+
+def _default_cache_path() -> Path:
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "dorc" / "http.sqlite"
+
+
+class ResponseCache:
+    """SQLite-backed cache for immutable HTTP response bodies, keyed by full URL.
+
+    Used by DorcClient for terminal runs: once a run's pipeline_status is
+    COMPLETE or ERROR its state and chunk results never change, so repeated
+    reads can be served from disk instead of the network. Entries expire
+    after ``ttl_s`` and the oldest rows are evicted beyond ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        ttl_s: float = 86400.0,
+        max_entries: int = 1024,
+    ):
+        self.path = Path(path) if path else _default_cache_path()
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path))
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "  key TEXT PRIMARY KEY,"
+            "  body BLOB NOT NULL,"
+            "  created_at REAL NOT NULL"
+            ")"
+        )
+        self._db.commit()
+
+    def get(self, key: str) -> bytes | None:
+        row = self._db.execute(
+            "SELECT body, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        body, created_at = row
+        if time.time() - created_at > self.ttl_s:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+            return None
+        return bytes(body)
+
+    def set(self, key: str, body: bytes) -> None:
+        now = time.time()
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses (key, body, created_at) VALUES (?, ?, ?)",
+            (key, body, now),
+        )
+        # Evict oldest rows beyond max_entries (cheap LRU approximation).
+        self._db.execute(
+            "DELETE FROM responses WHERE key IN ("
+            "  SELECT key FROM responses ORDER BY created_at DESC"
+            "  LIMIT -1 OFFSET ?"
+            ")",
+            (self.max_entries,),
+        )
+        self._db.commit()
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def clear(self) -> None:
+        self._db.execute("DELETE FROM responses")
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
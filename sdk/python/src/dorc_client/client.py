@@ -1,373 +1,1288 @@
-from __future__ import annotations
-
-import os
-import re
-import time
-import warnings
-from typing import Any
-
-import httpx
-from tenacity import (
-    retry,
-    retry_if_exception,
-    retry_if_result,
-    stop_after_attempt,
-    wait_exponential,
-)
-
-from .auth import api_key_headers, bearer_headers
-from .config import Config
-from .errors import DorcAuthError, DorcError
-from .models import (
-    TENANT_SLUG_REGEX,
-    Candidate,
-    ChunkResult,
-    ChunkResultsResponse,
-    RunStateResponse,
-    ValidateOptions,
-    ValidateRequest,
-    ValidateResponse,
-)
-
-_TENANT_RE = re.compile(TENANT_SLUG_REGEX)
-
-
-def _is_transient_exc(exc: BaseException) -> bool:
-    return isinstance(exc, httpx.TimeoutException | httpx.NetworkError)
-
-
-def _is_transient_response(resp: httpx.Response) -> bool:
-    return resp.status_code in (429, 500, 502, 503, 504)
-
-
-def _retry_get():
-    return retry(
-        retry=(
-            retry_if_exception(_is_transient_exc)
-            | retry_if_result(_is_transient_response)
-        ),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=0.5, min=0.5, max=4),
-        reraise=True,
-    )
-
-
-class DorcClient:
-    """Python SDK for DORC capability-based authentication.
-
-    Accepts a Bearer token (API key or JWT) and forwards it to MCP.
-    The SDK does NOT generate tokens - tokens must be provided by the caller.
-    """
-
-    def __init__(
-        self,
-        *,
-        base_url: str | None = None,
-        token: str | None = None,
-        timeout_s: float = 30.0,
-        validate_timeout_s: float = 300.0,
-        config: Config | None = None,
-        request_id: str | None = None,
-    ):
-        if config is None:
-            if base_url is None and token is None:
-                config = Config.from_env()
-            else:
-                # MCP mode: token is a Bearer token (API key or JWT)
-                config = Config(
-                    base_url=(base_url or "").rstrip("/"),
-                    mode="mcp",
-                    token=token,
-                )
-
-        self.config = config
-        self._default_request_id = (
-            (request_id or os.getenv("DORC_REQUEST_ID") or "").strip() or None
-        )
-        self._timeout = httpx.Timeout(timeout_s)
-        self._validate_timeout = httpx.Timeout(validate_timeout_s)
-        self._client = httpx.Client(
-            base_url=self.config.base_url,
-            headers={},  # auth headers are per-request
-        )
-
-    def _require_token(self) -> str:
-        """Get Bearer token, raising clear error if missing."""
-        if self.config.mode != "mcp":
-            raise DorcError(
-                status_code=500,
-                code="CONFIG_ERROR",
-                message="Token is only required in MCP mode",
-            )
-        token = (self.config.token or "").strip() or None
-        if not token:
-            raise DorcAuthError(
-                status_code=401,
-                code="UNAUTHENTICATED",
-                message=(
-                    "Bearer token is required. "
-                    "Set token parameter or DORC_TOKEN environment variable."
-                ),
-            )
-        return token
-
-    def close(self) -> None:
-        self._client.close()
-
-    def __enter__(self) -> DorcClient:
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        self.close()
-
-    @classmethod
-    def for_mcp(
-        cls,
-        base_url: str,
-        *,
-        token: str,
-        timeout_s: float = 30.0,
-        validate_timeout_s: float = 300.0,
-    ) -> DorcClient:
-        """Create client for MCP mode with Bearer token.
-
-        Args:
-            base_url: MCP service URL
-            token: Bearer token (API key or JWT) - required
-            timeout_s: Request timeout in seconds
-            validate_timeout_s: Validation request timeout in seconds
-        """
-        cfg = Config(
-            base_url=base_url.rstrip("/"),
-            mode="mcp",
-            token=token.strip() if token else None,
-        )
-        return cls(
-            config=cfg,
-            timeout_s=timeout_s,
-            validate_timeout_s=validate_timeout_s,
-        )
-
-    @classmethod
-    def for_engine(
-        cls,
-        base_url: str,
-        *,
-        api_key: str,
-        tenant_slug: str,
-        timeout_s: float = 30.0,
-        validate_timeout_s: float = 300.0,
-    ) -> DorcClient:
-        tenant_slug = tenant_slug.strip()
-        if not _TENANT_RE.fullmatch(tenant_slug):
-            raise ValueError(f"invalid tenant_slug (must match {TENANT_SLUG_REGEX})")
-        cfg = Config(
-            base_url=base_url.rstrip("/"),
-            mode="engine",
-            tenant_slug=tenant_slug,
-            api_key=api_key,
-        )
-        return cls(config=cfg, timeout_s=timeout_s, validate_timeout_s=validate_timeout_s)
-
-    def _auth_headers(
-        self, require_auth: bool = True, request_id: str | None = None
-    ) -> dict[str, str]:
-        """Get auth headers. require_auth=False for health endpoints."""
-        headers: dict[str, str] = {}
-        req_id = (request_id or self._default_request_id or "").strip() or None
-        if req_id:
-            headers["X-Request-Id"] = req_id
-        if not require_auth:
-            return headers
-        if self.config.mode == "mcp":
-            token = self._require_token()
-            headers.update(bearer_headers(token))
-            return headers
-        # engine-direct (legacy) - not part of contract but kept for compatibility
-        headers.update(api_key_headers(self.config.api_key))
-        return headers
-
-    def _raise_for_status(self, resp: httpx.Response) -> None:
-        if 200 <= resp.status_code < 300:
-            return
-
-        text: str | None
-        try:
-            text = resp.text
-        except Exception:
-            text = None
-
-        # Prefer contract error envelope.
-        code = "HTTP_ERROR"
-        message = "request failed"
-        request_id = None
-        try:
-            payload = resp.json()
-            if isinstance(payload, dict) and isinstance(payload.get("error"), dict):
-                err = payload["error"]
-                code = str(err.get("code") or code)
-                message = str(err.get("message") or message)
-                request_id = str(err.get("request_id")) if err.get("request_id") else None
-        except Exception:
-            pass
-
-        if resp.status_code in (401, 403):
-            raise DorcAuthError(
-                resp.status_code,
-                code=code,
-                message=message,
-                request_id=request_id,
-                response_text=text,
-            )
-
-        raise DorcError(
-            resp.status_code,
-            code=code,
-            message=message,
-            request_id=request_id,
-            response_text=text,
-        )
-
-    @_retry_get()
-    def _get(self, path: str) -> httpx.Response:
-        resp = self._client.get(path, timeout=self._timeout, headers=self._auth_headers())
-        if _is_transient_response(resp):
-            return resp
-        self._raise_for_status(resp)
-        return resp
-
-    def health(self) -> dict[str, Any]:
-        """GET /health - Returns health status (no auth required)."""
-        r = self._client.get(
-            "/health",
-            timeout=self._timeout,
-            headers=self._auth_headers(require_auth=False),
-        )
-        self._raise_for_status(r)
-        return r.json()
-
-    def healthz(self) -> dict[str, Any]:
-        """GET /healthz - Returns health status (no auth required)."""
-        r = self._client.get(
-            "/healthz",
-            timeout=self._timeout,
-            headers=self._auth_headers(require_auth=False),
-        )
-        self._raise_for_status(r)
-        return r.json()
-
-    def validate(
-        self,
-        *,
-        candidate_content: str | None = None,
-        content_type: str = "text/markdown",
-        mode: str = "audit",
-        title: str | None = None,
-        metadata: dict[str, str] | None = None,
-        options: dict[str, Any] | None = None,
-        request_id: str | None = None,
-        # legacy args (deprecated)
-        content: str | None = None,
-        candidate_text: str | None = None,
-        candidate_id: str | None = None,
-        candidate_title: str | None = None,
-        context: dict[str, Any] | None = None,
-    ) -> ValidateResponse:
-        """POST /v1/validate (contract-native).
-
-        In MCP mode, tenant is derived by MCP from the JWT.
-        In engine-direct mode, tenant is required.
-        """
-        # Deprecation adapter: old callers used content=/candidate_text=
-        # and candidate_id/title/context.
-        if candidate_content is None and (content is not None or candidate_text is not None):
-            warnings.warn(
-                (
-                    "validate(content=...)/validate(candidate_text=...) is deprecated; "
-                    "use validate(candidate_content=...)."
-                ),
-                DeprecationWarning,
-                stacklevel=2,
-            )
-            candidate_content = content or candidate_text
-            title = title or candidate_title
-            if metadata is None and context is not None and isinstance(context, dict):
-                # Best-effort: map context.tags into labels
-                metadata = {k: str(v) for k, v in context.items() if isinstance(k, str)}
-
-        if candidate_content is None or not str(candidate_content).strip():
-            raise ValueError("validate() requires candidate_content=... (non-empty)")
-
-        validate_options = ValidateOptions(**(options or {}))
-        req = ValidateRequest(
-            request_id=request_id,
-            mode=mode,  # type: ignore[arg-type]
-            candidate=Candidate(
-                content=str(candidate_content),
-                content_type=content_type,  # type: ignore[arg-type]
-                title=title,
-                labels=metadata,
-                cce_id=candidate_id,
-            ),
-            options=validate_options,
-        )
-
-        payload = req.model_dump(exclude_none=True)
-        if not payload.get("request_id") and self._default_request_id:
-            payload["request_id"] = self._default_request_id
-
-        # Engine-direct requires tenant_slug; MCP must not include it.
-        if self.config.mode == "engine":
-            tenant = (self.config.tenant_slug or "").strip()
-            if not tenant:
-                raise ValueError("tenant_slug is required for engine-direct client")
-            if not _TENANT_RE.fullmatch(tenant):
-                raise ValueError(f"invalid tenant_slug (must match {TENANT_SLUG_REGEX})")
-            payload["tenant_slug"] = tenant
-            payload["actor"] = {"subject": "sdk"}
-
-        resp = self._client.post(
-            "/v1/validate",
-            json=payload,
-            timeout=self._validate_timeout,
-            headers=self._auth_headers(require_auth=True, request_id=payload.get("request_id")),
-        )
-        self._raise_for_status(resp)
-        return ValidateResponse.model_validate(resp.json())
-
-    def get_run(self, run_id: str) -> RunStateResponse:
-        resp = self._get(f"/v1/runs/{run_id}")
-        return RunStateResponse.model_validate(resp.json())
-
-    def list_chunks(self, run_id: str) -> list[ChunkResult]:
-        resp = self._get(f"/v1/runs/{run_id}/chunks")
-        parsed = ChunkResultsResponse.model_validate(resp.json())
-        return parsed.chunks
-
-    def wait_for_completion(
-        self,
-        run_id: str,
-        *,
-        poll_interval_s: float = 2.0,
-        timeout_s: float = 60.0,
-    ) -> RunStateResponse:
-        """Poll /v1/runs/{run_id} until pipeline_status != RUNNING (best-effort helper).
-
-        Args:
-            run_id: Run identifier
-            poll_interval_s: Polling interval in seconds
-            timeout_s: Timeout in seconds
-
-        Note: In MCP mode, tenant is extracted from the Bearer token by MCP.
-        Note: engine currently exposes `pipeline_status` not contract `status`.
-        """
-        deadline = time.time() + timeout_s
-        while True:
-            r = self.get_run(run_id)
-            if str(r.pipeline_status).upper() != "RUNNING":
-                return r
-            if time.time() >= deadline:
-                raise TimeoutError(f"timeout waiting for run {run_id}")
-            time.sleep(poll_interval_s)
-
-
+from __future__ import annotations
+
+import base64
+import functools
+import hashlib
+import json
+import os
+import random
+import socket
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
+from typing import Any, TypeVar
+
+import httpx
+
+try:  # optional: incremental JSON parsing for streamed chunk lists
+    import ijson
+except ImportError:  # pragma: no cover - exercised when extras are absent
+    ijson = None
+
+try:  # optional: C JSON decoding for the raw dict path
+    import msgspec
+    import msgspec.json as _msgspec_json
+except ImportError:  # pragma: no cover - exercised when extras are absent
+    msgspec = None
+    _msgspec_json = None
+
+if msgspec is not None:  # Struct decoders for the strict_parse=False fast path
+    from . import models_fast as _fast
+else:  # pragma: no cover - exercised when extras are absent
+    _fast = None
+from tenacity import (
+    retry,
+    retry_if_exception,
+    retry_if_result,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from .auth import api_key_headers, bearer_headers
+from .cache import ResponseCache
+from .config import Config
+from .errors import DorcAuthError, DorcError
+from .models import (
+    TENANT_SLUG_REGEX,
+    ChunkResult,
+    ChunkResultsResponse,
+    ContentSummary,
+    Counts,
+    EvidenceItem,
+    Links,
+    RunStateResponse,
+    ValidateResponse,
+)
+from .version import __version__
+
+try:  # optional: RE2 guarantees linear-time matching (no backtracking blowups)
+    import re2 as _re
+except ImportError:  # pragma: no cover - exercised when extras are absent
+    import re as _re
+
+# Compiled once at import; fullmatch has the same API under re and re2.
+_TENANT_RE = _re.compile(TENANT_SLUG_REGEX)
+
+
+@functools.lru_cache(maxsize=256)
+def _validated_tenant(slug: str) -> str:
+    """Strip and regex-validate a tenant slug once per unique value.
+
+    Tenant slugs are effectively constant per client, so the strip/fullmatch
+    work on the validate hot path collapses to a cache lookup.
+    """
+    slug = slug.strip()
+    if not _TENANT_RE.fullmatch(slug):
+        raise ValueError(f"invalid tenant_slug (must match {TENANT_SLUG_REGEX})")
+    return slug
+
+
+# Constant actor stamped on engine-direct validate payloads; shared rather
+# than re-allocated per request (serialized read-only).
+_SDK_ACTOR = {"subject": "sdk"}
+
+# Shared pool sizing: keep connections alive across calls so polling loops
+# (get_run/list_chunks) reuse one TCP+TLS connection instead of re-handshaking.
+_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=60.0,
+)
+
+def _accept_encoding() -> str:
+    """Advertise only the content encodings httpx can decode in this env.
+
+    gzip/deflate always work; br is added when the optional brotli/brotlicffi
+    package is installed (pip install dorc-client[fast]) - the same probe
+    httpx uses to build its decoder table. zstd is gated on that table
+    directly: the zstandard package alone is not enough, since httpx only
+    grew zstd response decoding in 0.28 and we allow >=0.25. Advertising an
+    encoding httpx can't decode would hand callers a compressed body that
+    fails every JSON parse. Brotli and zstd cut wire bytes several-fold on
+    chunk-heavy JSON.
+    """
+    encodings = ["gzip", "deflate"]
+    try:
+        import brotli  # noqa: F401
+
+        encodings.insert(0, "br")
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+
+            encodings.insert(0, "br")
+        except ImportError:
+            pass
+    try:
+        from httpx._decoders import SUPPORTED_DECODERS
+    except ImportError:  # pragma: no cover - private module moved
+        pass
+    else:
+        if "zstd" in SUPPORTED_DECODERS:
+            encodings.insert(0, "zstd")
+    return ", ".join(encodings)
+
+
+# Static headers set once at the client level instead of being rebuilt and
+# re-serialized on every request. Auth stays per-request.
+_BASE_HEADERS = {
+    "User-Agent": f"dorc-client/{__version__}",
+    "Accept": "application/json",
+    "Accept-Encoding": _accept_encoding(),
+}
+
+# Merged into per-request auth headers on POST paths; a shared constant so
+# the key/value pair isn't rebuilt per call.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+_ModelT = TypeVar("_ModelT", RunStateResponse, ChunkResultsResponse, ValidateResponse)
+
+# Memoized response parsing: polling loops (wait_for_completion, MCP
+# dorc_get_run) re-fetch byte-identical payloads, so key the parsed model on a
+# digest of the raw bytes and skip the pydantic validation walk on repeats.
+# The lock matters because validate_batch's 404 fallback drives a client from
+# a thread pool.
+_PARSE_CACHE_MAX = 256
+_parse_cache: OrderedDict[tuple[type, bytes], Any] = OrderedDict()
+_parse_lock = threading.Lock()
+
+
+_VALIDATE_PATH = "/v1/validate"
+_VALIDATE_BATCH_PATH = "/v1/validate:batch"
+
+# Pre-parsed request targets: httpx runs its URL parser on every str target,
+# but merging an existing httpx.URL into base_url is a cheap copy. The str
+# forms above stay the basis of the disk-cache keys (see _cache_key).
+_VALIDATE_URL = httpx.URL(_VALIDATE_PATH)
+_VALIDATE_BATCH_URL = httpx.URL(_VALIDATE_BATCH_PATH)
+
+
+# Cached per run_id: polling loops hit the same paths dozens of times, so
+# skip the repeated f-string allocation.
+@functools.lru_cache(maxsize=1024)
+def _run_path(run_id: str) -> str:
+    return f"/v1/runs/{run_id}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _chunks_path(run_id: str) -> str:
+    return f"/v1/runs/{run_id}/chunks"
+
+
+@functools.lru_cache(maxsize=1024)
+def _run_url(run_id: str) -> httpx.URL:
+    return httpx.URL(_run_path(run_id))
+
+
+@functools.lru_cache(maxsize=1024)
+def _chunks_url(run_id: str) -> httpx.URL:
+    return httpx.URL(_chunks_path(run_id))
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes with msgspec when available, else stdlib json."""
+    if _msgspec_json is not None:
+        return _msgspec_json.decode(raw)
+    return json.loads(raw)
+
+
+def _parse_response(model: type[_ModelT], raw: bytes) -> _ModelT:
+    key = (model, hashlib.blake2b(raw, digest_size=16).digest())
+    with _parse_lock:
+        hit = _parse_cache.get(key)
+        if hit is not None:
+            _parse_cache.move_to_end(key)
+    if hit is None:
+        hit = model.model_validate_json(raw)
+        with _parse_lock:
+            _parse_cache[key] = hit
+            if len(_parse_cache) > _PARSE_CACHE_MAX:
+                _parse_cache.popitem(last=False)
+    # The cached instance is a master shared across clients; hand every
+    # caller its own deep copy so mutating a result (or its nested meta/
+    # chunks containers) can't poison later hits. model_copy skips the
+    # validation walk, which is where the time goes.
+    return hit.model_copy(deep=True)
+
+
+# Trusted-server fast path (strict_parse=False): model_construct skips the
+# pydantic validation walk entirely, which is roughly an order of magnitude
+# faster on chunk-heavy payloads. Aliased fields (pass/PASS etc.) bypass
+# alias resolution under model_construct, so nested models are built by hand.
+
+
+def _construct_validate_response(payload: dict[str, Any]) -> ValidateResponse:
+    counts = payload.get("counts") or {}
+    return ValidateResponse.model_construct(
+        request_id=payload.get("request_id"),
+        run_id=payload.get("run_id"),
+        status=payload.get("status"),
+        result=payload.get("result"),
+        counts=Counts.model_construct(
+            pass_=counts.get("PASS", 0),
+            fail=counts.get("FAIL", 0),
+            warn=counts.get("WARN", 0),
+            error=counts.get("ERROR", 0),
+            total_chunks=counts.get("total_chunks", 0),
+        ),
+        links=Links.model_construct(**(payload.get("links") or {})),
+    )
+
+
+def _construct_run_state(payload: dict[str, Any]) -> RunStateResponse:
+    summary = payload.get("content_summary") or {}
+    return RunStateResponse.model_construct(
+        run_id=payload.get("run_id"),
+        tenant_slug=payload.get("tenant_slug"),
+        pipeline_status=payload.get("pipeline_status"),
+        content_summary=ContentSummary.model_construct(
+            pass_=summary.get("pass", 0),
+            fail=summary.get("fail", 0),
+            warn=summary.get("warn", 0),
+            error=summary.get("error", 0),
+        ),
+        inserted_at=payload.get("inserted_at"),
+        meta=payload.get("meta") or {},
+    )
+
+
+def _construct_chunk(chunk: dict[str, Any]) -> ChunkResult:
+    return ChunkResult.model_construct(
+        chunk_id=chunk.get("chunk_id"),
+        index=chunk.get("index"),
+        status=chunk.get("status"),
+        model_used=chunk.get("model_used"),
+        finding_count=chunk.get("finding_count", 0),
+        message=chunk.get("message", ""),
+        evidence=[EvidenceItem.model_construct(**e) for e in chunk.get("evidence") or []],
+        details=chunk.get("details"),
+    )
+
+
+# With msgspec installed, the lenient path decodes response bytes straight
+# into models_fast Structs (one C pass, no intermediate dicts) and rewraps
+# them with model_construct so callers still see the pydantic types. Payloads
+# the Structs reject (missing required fields) fall back to the tolerant
+# dict walk above.
+
+
+def _from_fast_chunk(chunk: Any) -> ChunkResult:
+    return ChunkResult.model_construct(
+        chunk_id=chunk.chunk_id,
+        index=chunk.index,
+        status=chunk.status,
+        model_used=chunk.model_used,
+        finding_count=chunk.finding_count,
+        message=chunk.message,
+        evidence=[
+            EvidenceItem.model_construct(source=e.source, excerpt=e.excerpt, note=e.note)
+            for e in chunk.evidence
+        ],
+        details=chunk.details,
+    )
+
+
+def _parse_validate_lenient(raw: bytes) -> ValidateResponse:
+    if _fast is not None:
+        try:
+            v = _fast.validate_response_decoder.decode(raw)
+        except msgspec.DecodeError:
+            pass
+        else:
+            return ValidateResponse.model_construct(
+                request_id=v.request_id,
+                run_id=v.run_id,
+                status=v.status,
+                result=v.result,
+                counts=Counts.model_construct(
+                    pass_=v.counts.pass_,
+                    fail=v.counts.fail,
+                    warn=v.counts.warn,
+                    error=v.counts.error,
+                    total_chunks=v.counts.total_chunks,
+                ),
+                links=Links.model_construct(run=v.links.run, chunks=v.links.chunks),
+            )
+    return _construct_validate_response(_loads(raw))
+
+
+def _parse_run_state_lenient(raw: bytes) -> RunStateResponse:
+    if _fast is not None:
+        try:
+            r = _fast.run_state_decoder.decode(raw)
+        except msgspec.DecodeError:
+            pass
+        else:
+            return RunStateResponse.model_construct(
+                run_id=r.run_id,
+                tenant_slug=r.tenant_slug,
+                pipeline_status=r.pipeline_status,
+                content_summary=ContentSummary.model_construct(
+                    pass_=r.content_summary.pass_,
+                    fail=r.content_summary.fail,
+                    warn=r.content_summary.warn,
+                    error=r.content_summary.error,
+                ),
+                inserted_at=r.inserted_at,
+                meta=r.meta,
+            )
+    return _construct_run_state(_loads(raw))
+
+
+def _parse_chunks_lenient(raw: bytes) -> list[ChunkResult]:
+    if _fast is not None:
+        try:
+            page = _fast.chunk_results_decoder.decode(raw)
+        except msgspec.DecodeError:
+            pass
+        else:
+            return [_from_fast_chunk(c) for c in page.chunks]
+    return [_construct_chunk(c) for c in _loads(raw).get("chunks") or []]
+
+
+class _ByteStreamReader:
+    """Minimal file-like adapter over an iterator of bytes (for ijson)."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buf = b""
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            out = b"".join([self._buf, *self._chunks])
+            self._buf = b""
+            return out
+        while len(self._buf) < size:
+            nxt = next(self._chunks, None)
+            if nxt is None:
+                break
+            self._buf += nxt
+        out, self._buf = self._buf[:size], self._buf[size:]
+        return out
+
+
+# TTL matches the pool's keepalive_expiry: a reconnect after idle is exactly
+# when the resolve would otherwise be repaid.
+_DNS_CACHE_TTL_S = 60.0
+_DNS_CACHE_MAX = 128
+_dns_cache: OrderedDict[tuple[Any, ...], tuple[float, list[Any]]] = OrderedDict()
+_dns_lock = threading.Lock()
+_dns_cache_installed = False
+
+
+def _install_dns_cache() -> None:
+    """Install a process-wide TTL cache in front of ``socket.getaddrinfo``.
+
+    httpx does not cache DNS, so every cold-pool reconnect (keepalive_expiry
+    firing between polls) pays a fresh resolve - a 5-50ms tax behind the
+    short-TTL records typical of Cloud Run. Idempotent, and only installed
+    when a client opts in via ``enable_dns_cache=True``, since it patches
+    socket for the whole process. Failed resolves are never cached.
+    """
+    global _dns_cache_installed
+    with _dns_lock:
+        if _dns_cache_installed:
+            return
+        real_getaddrinfo = socket.getaddrinfo
+
+        def cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+            key = (host, port, family, type, proto, flags)
+            now = time.monotonic()
+            with _dns_lock:
+                hit = _dns_cache.get(key)
+                if hit is not None and now - hit[0] < _DNS_CACHE_TTL_S:
+                    _dns_cache.move_to_end(key)
+                    return hit[1]
+            result = real_getaddrinfo(host, port, family, type, proto, flags)
+            with _dns_lock:
+                _dns_cache[key] = (now, result)
+                if len(_dns_cache) > _DNS_CACHE_MAX:
+                    _dns_cache.popitem(last=False)
+            return result
+
+        socket.getaddrinfo = cached_getaddrinfo
+        _dns_cache_installed = True
+
+
+@functools.lru_cache(maxsize=16)
+def _jwt_exp(token: str) -> float | None:
+    """Best-effort ``exp`` claim of a JWT, or None if the token isn't one.
+
+    Cached per token string so the base64/json work happens once, not on
+    every request. No signature verification - this only exists to avoid a
+    guaranteed 401 round-trip on a token we can already see is expired.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        payload = parts[1] + "=" * (-len(parts[1]) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        # The middle segment may decode to valid JSON that isn't an object
+        # (e.g. an array); treat anything but a claims dict as "not a JWT".
+        if not isinstance(claims, dict):
+            return None
+        exp = claims.get("exp")
+        return float(exp) if exp is not None else None
+    except (ValueError, TypeError):
+        return None
+
+
+def _validate_payload(
+    *,
+    candidate_content: str,
+    content_type: str = "text/markdown",
+    mode: str = "audit",
+    title: str | None = None,
+    metadata: dict[str, str] | None = None,
+    options: dict[str, Any] | None = None,
+    request_id: str | None = None,
+    candidate_id: str | None = None,
+    extra: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Build the /v1/validate wire payload as a plain dict.
+
+    Outbound pydantic validation is redundant with the engine's own, and
+    skipping the model walk removes per-call allocations. ValidateRequest
+    stays exported for callers that want typed request construction.
+    """
+    candidate: dict[str, Any] = {
+        "content": str(candidate_content),
+        "content_type": content_type,
+    }
+    if candidate_id is not None:
+        candidate["cce_id"] = candidate_id
+    if title is not None:
+        candidate["title"] = title
+    if metadata is not None:
+        candidate["labels"] = metadata
+
+    opts = dict(options or {})
+    chunking = {"max_chars": 3500, "overlap_chars": 250, **(opts.pop("chunking", None) or {})}
+    models = {k: v for k, v in (opts.pop("models", None) or {}).items() if v is not None}
+
+    payload: dict[str, Any] = {
+        "mode": mode,
+        "candidate": candidate,
+        "options": {"chunking": chunking, "models": models, **opts},
+    }
+    if request_id is not None:
+        payload["request_id"] = request_id
+    if extra:
+        payload.update(extra)
+    return payload
+
+
+def _map_legacy_validate_args(
+    content: str | None,
+    candidate_text: str | None,
+    title: str | None,
+    candidate_title: str | None,
+    metadata: dict[str, str] | None,
+    context: dict[str, Any] | None,
+    *,
+    stacklevel: int,
+) -> tuple[str | None, str | None, dict[str, str] | None]:
+    """Cold-path adapter for the deprecated validate() keyword arguments.
+
+    Kept out of line so modern callers pay a single None check instead of the
+    warning machinery and context mapping. ``stacklevel`` must point the
+    warning at the user's call site: counting from this frame, the sync path
+    is validate -> _post_validate -> here (4), the async path is
+    validate -> here (3).
+    """
+    warnings.warn(
+        (
+            "validate(content=...)/validate(candidate_text=...) is deprecated; "
+            "use validate(candidate_content=...)."
+        ),
+        DeprecationWarning,
+        stacklevel=stacklevel,
+    )
+    candidate_content = content or candidate_text
+    title = title or candidate_title
+    if metadata is None and context is not None and isinstance(context, dict):
+        # Best-effort: map context.tags into labels
+        metadata = {k: str(v) for k, v in context.items() if isinstance(k, str)}
+    return candidate_content, title, metadata
+
+
+def _is_transient_exc(exc: BaseException) -> bool:
+    return isinstance(exc, httpx.TimeoutException | httpx.NetworkError)
+
+
+_TRANSIENT: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_transient_response(resp: httpx.Response) -> bool:
+    return resp.status_code in _TRANSIENT
+
+
+# Full-jitter exponential backoff: without jitter, N clients backing off in
+# lockstep re-arrive at the server in waves, prolonging 429/503 storms.
+_JITTERED_WAIT = wait_exponential_jitter(initial=0.5, max=4.0, jitter=0.5)
+
+# Upper bound on server-supplied Retry-After so a misbehaving header cannot
+# stall a retry loop for minutes.
+_RETRY_AFTER_CAP_S = 30.0
+
+
+def _wait_jittered_retry_after(retry_state: Any) -> float:
+    """Jittered backoff, raised to the server's Retry-After when sent."""
+    delay = _JITTERED_WAIT(retry_state)
+    outcome = retry_state.outcome
+    if outcome is not None and not outcome.failed:
+        resp = outcome.result()
+        retry_after = resp.headers.get("Retry-After") if isinstance(resp, httpx.Response) else None
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), _RETRY_AFTER_CAP_S))
+            except ValueError:
+                pass  # HTTP-date form; keep the jittered delay
+    return delay
+
+
+def _retry_get():
+    return retry(
+        retry=(
+            retry_if_exception(_is_transient_exc)
+            | retry_if_result(_is_transient_response)
+        ),
+        stop=stop_after_attempt(3),
+        wait=_wait_jittered_retry_after,
+        reraise=True,
+    )
+
+
+def _retry_post_idempotent():
+    # Retried POSTs are only issued with an Idempotency-Key.
+    return retry(
+        retry=(
+            retry_if_exception(_is_transient_exc)
+            | retry_if_result(_is_transient_response)
+        ),
+        stop=stop_after_attempt(3),
+        wait=_wait_jittered_retry_after,
+        reraise=True,
+    )
+
+
+class DorcClient:
+    """Python SDK for DORC capability-based authentication.
+
+    Accepts a Bearer token (API key or JWT) and forwards it to MCP.
+    The SDK does NOT generate tokens - tokens must be provided by the caller.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str | None = None,
+        token: str | None = None,
+        timeout_s: float = 30.0,
+        validate_timeout_s: float = 300.0,
+        config: Config | None = None,
+        request_id: str | None = None,
+        http2: bool = False,
+        cache: bool | str | os.PathLike = False,
+        validate_cache_size: int = 0,
+        strict_parse: bool = True,
+        enable_dns_cache: bool = False,
+    ):
+        if config is None:
+            if base_url is None and token is None:
+                config = Config.from_env()
+            else:
+                # MCP mode: token is a Bearer token (API key or JWT)
+                config = Config(
+                    base_url=(base_url or "").rstrip("/"),
+                    mode="mcp",
+                    token=token,
+                )
+
+        self.config = config
+        self._default_request_id = (
+            (request_id or os.getenv("DORC_REQUEST_ID") or "").strip() or None
+        )
+        # Engine auth never changes over the client's life; precompute an
+        # immutable view once so the hot path skips a dict build per request.
+        self._engine_auth: Mapping[str, str] | None = (
+            MappingProxyType(api_key_headers(self.config.api_key))
+            if self.config.mode == "engine"
+            else None
+        )
+        self._timeout = httpx.Timeout(timeout_s)
+        self._validate_timeout = httpx.Timeout(validate_timeout_s)
+        # http2=True requires the optional `h2` package (pip install dorc-client[http2]);
+        # servers that only speak HTTP/1.1 are negotiated down transparently.
+        self._client = httpx.Client(
+            base_url=self.config.base_url,
+            headers=_BASE_HEADERS,  # auth headers stay per-request
+            transport=httpx.HTTPTransport(retries=1, http2=http2, limits=_LIMITS),
+        )
+        # Optional on-disk cache for terminal (immutable) run responses.
+        # cache=True uses the default path; a str/PathLike selects the file.
+        self._cache: ResponseCache | None = None
+        if cache:
+            self._cache = ResponseCache(None if cache is True else cache)
+        # Opt-in in-memory cache of validate responses keyed by submission
+        # identity (tenant, candidate_id, mode, content_type, title,
+        # metadata, content, options - the full wire payload). Off by
+        # default: a hit skips the engine run entirely, so only enable it for
+        # callers that treat validation as a pure function of the content.
+        self._validate_cache_size = validate_cache_size
+        self._validate_cache: OrderedDict[bytes, httpx.Response] | None = (
+            OrderedDict() if validate_cache_size > 0 else None
+        )
+        # Same reasoning as _parse_lock: validate_batch's 404 fallback drives
+        # validate() from a thread pool, and OrderedDict mutation isn't safe
+        # under concurrent move_to_end/popitem.
+        self._validate_cache_lock = threading.Lock()
+        # strict_parse=False trades response validation for model_construct
+        # speed; only sensible against a trusted engine on the same contract.
+        self._strict_parse = strict_parse
+        # Tri-state: None = unknown, False = server 404'd the SSE events
+        # endpoint (remembered so later waits skip the probe).
+        self._events_supported: bool | None = None
+        # Health endpoint that last answered 2xx; probe_health re-probes both
+        # only when this one stops responding.
+        self._health_path: str | None = None
+        # Opt-in (process-wide): cache getaddrinfo results so cold-pool
+        # reconnects between polls skip the DNS round trip.
+        if enable_dns_cache:
+            _install_dns_cache()
+
+    def _require_token(self) -> str:
+        """Get Bearer token, raising clear error if missing."""
+        if self.config.mode != "mcp":
+            raise DorcError(
+                status_code=500,
+                code="CONFIG_ERROR",
+                message="Token is only required in MCP mode",
+            )
+        token = (self.config.token or "").strip() or None
+        if not token:
+            raise DorcAuthError(
+                status_code=401,
+                code="UNAUTHENTICATED",
+                message=(
+                    "Bearer token is required. "
+                    "Set token parameter or DORC_TOKEN environment variable."
+                ),
+            )
+        # Fail fast on a visibly expired JWT (30s margin) instead of paying a
+        # guaranteed 401 round-trip; opaque tokens (no exp) pass through.
+        exp = _jwt_exp(token)
+        if exp is not None and time.time() >= exp - 30.0:
+            raise DorcAuthError(
+                status_code=401,
+                code="UNAUTHENTICATED",
+                message="Bearer token is expired (or expires within 30s); refresh the JWT.",
+            )
+        return token
+
+    def close(self) -> None:
+        self._client.close()
+        if self._cache is not None:
+            self._cache.close()
+
+    def __enter__(self) -> DorcClient:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @classmethod
+    def for_mcp(
+        cls,
+        base_url: str,
+        *,
+        token: str,
+        timeout_s: float = 30.0,
+        validate_timeout_s: float = 300.0,
+    ) -> DorcClient:
+        """Create client for MCP mode with Bearer token.
+
+        Args:
+            base_url: MCP service URL
+            token: Bearer token (API key or JWT) - required
+            timeout_s: Request timeout in seconds
+            validate_timeout_s: Validation request timeout in seconds
+        """
+        cfg = Config(
+            base_url=base_url.rstrip("/"),
+            mode="mcp",
+            token=token.strip() if token else None,
+        )
+        return cls(
+            config=cfg,
+            timeout_s=timeout_s,
+            validate_timeout_s=validate_timeout_s,
+        )
+
+    @classmethod
+    def for_engine(
+        cls,
+        base_url: str,
+        *,
+        api_key: str,
+        tenant_slug: str,
+        timeout_s: float = 30.0,
+        validate_timeout_s: float = 300.0,
+    ) -> DorcClient:
+        cfg = Config(
+            base_url=base_url.rstrip("/"),
+            mode="engine",
+            tenant_slug=_validated_tenant(tenant_slug),
+            api_key=api_key,
+        )
+        return cls(config=cfg, timeout_s=timeout_s, validate_timeout_s=validate_timeout_s)
+
+    def _auth_headers(
+        self, require_auth: bool = True, request_id: str | None = None
+    ) -> Mapping[str, str]:
+        """Get auth headers. require_auth=False for health endpoints.
+
+        May return a shared read-only mapping (httpx accepts any Mapping);
+        callers that add headers must copy rather than mutate.
+        """
+        req_id = (request_id or self._default_request_id or "").strip() or None
+        if require_auth and req_id is None:
+            # Hot path (polling): headers are fully determined by config, so
+            # return the precomputed/memoized mapping - no dict per request.
+            if self._engine_auth is not None:
+                return self._engine_auth
+            if self.config.mode == "mcp":
+                return bearer_headers(self._require_token())
+        headers: dict[str, str] = {}
+        if req_id:
+            headers["X-Request-Id"] = req_id
+        if not require_auth:
+            return headers
+        if self.config.mode == "mcp":
+            token = self._require_token()
+            headers.update(bearer_headers(token))
+            return headers
+        # engine-direct (legacy) - not part of contract but kept for compatibility
+        headers.update(api_key_headers(self.config.api_key))
+        return headers
+
+    def _raise_for_status(self, resp: httpx.Response) -> None:
+        if 200 <= resp.status_code < 300:
+            return
+
+        # Empty bodies (204s, LB-generated errors) skip all decode work.
+        has_body = bool(resp.content)
+        text: str | None = None
+        if has_body:
+            try:
+                text = resp.text
+            except Exception:
+                text = None
+
+        # Prefer contract error envelope; only attempt the parse when the
+        # server actually claims to be sending JSON.
+        code = "HTTP_ERROR"
+        message = "request failed"
+        request_id = None
+        if has_body and resp.headers.get("content-type", "").startswith("application/json"):
+            try:
+                payload = _loads(resp.content)
+                if isinstance(payload, dict) and isinstance(payload.get("error"), dict):
+                    err = payload["error"]
+                    code = str(err.get("code") or code)
+                    message = str(err.get("message") or message)
+                    request_id = str(err.get("request_id")) if err.get("request_id") else None
+            except Exception:
+                pass
+
+        if resp.status_code in (401, 403):
+            raise DorcAuthError(
+                resp.status_code,
+                code=code,
+                message=message,
+                request_id=request_id,
+                response_text=text,
+            )
+
+        raise DorcError(
+            resp.status_code,
+            code=code,
+            message=message,
+            request_id=request_id,
+            response_text=text,
+        )
+
+    @_retry_get()
+    def _get(self, url: str | httpx.URL) -> httpx.Response:
+        resp = self._client.get(url, timeout=self._timeout, headers=self._auth_headers())
+        if _is_transient_response(resp):
+            return resp
+        self._raise_for_status(resp)
+        return resp
+
+    def health(self) -> dict[str, Any]:
+        """GET /health - Returns health status (no auth required)."""
+        r = self._client.get(
+            "/health",
+            timeout=self._timeout,
+            headers=self._auth_headers(require_auth=False),
+        )
+        self._raise_for_status(r)
+        return r.json()
+
+    def healthz(self) -> dict[str, Any]:
+        """GET /healthz - Returns health status (no auth required)."""
+        r = self._client.get(
+            "/healthz",
+            timeout=self._timeout,
+            headers=self._auth_headers(require_auth=False),
+        )
+        self._raise_for_status(r)
+        return r.json()
+
+    def probe_health(self) -> bool:
+        """Probe /healthz and /health concurrently; True as soon as either is 2xx.
+
+        The sequential probe pattern (healthz, then health) pays both waits
+        when the first endpoint fails slowly; probing both at once bounds the
+        worst case to a single timeout, which matters for cold-start liveness
+        checks. The winning path is remembered, so repeated probes (liveness
+        loops) amortize to a single request until that path stops answering.
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        def _probe(path: str) -> bool:
+            r = self._client.get(
+                path,
+                timeout=self._timeout,
+                headers=self._auth_headers(require_auth=False),
+            )
+            return 200 <= r.status_code < 300
+
+        if self._health_path is not None:
+            try:
+                if _probe(self._health_path):
+                    return True
+            except httpx.HTTPError:
+                pass
+            # Cached path went dark; fall through and re-probe both.
+            self._health_path = None
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = {pool.submit(_probe, p): p for p in ("/healthz", "/health")}
+            for fut in as_completed(futures):
+                try:
+                    if fut.result():
+                        self._health_path = futures[fut]
+                        return True
+                except httpx.HTTPError:
+                    continue
+        return False
+
+    def _post_validate(
+        self,
+        *,
+        candidate_content: str | None = None,
+        content_type: str = "text/markdown",
+        mode: str = "audit",
+        title: str | None = None,
+        metadata: dict[str, str] | None = None,
+        options: dict[str, Any] | None = None,
+        request_id: str | None = None,
+        # legacy args (deprecated)
+        content: str | None = None,
+        candidate_text: str | None = None,
+        candidate_id: str | None = None,
+        candidate_title: str | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """Build and POST the /v1/validate request, returning the raw response."""
+        # Deprecation adapter: old callers used content=/candidate_text=
+        # and candidate_id/title/context (mapped out of line, see
+        # _map_legacy_validate_args).
+        if candidate_content is None and (content is not None or candidate_text is not None):
+            candidate_content, title, metadata = _map_legacy_validate_args(
+                content, candidate_text, title, candidate_title, metadata, context, stacklevel=4
+            )
+
+        if candidate_content is None or not str(candidate_content).strip():
+            raise ValueError("validate() requires candidate_content=... (non-empty)")
+
+        # Identity-keyed short-circuit: a byte-identical submission that was
+        # validated by this client moments ago returns the stored response.
+        cache_key: bytes | None = None
+        if self._validate_cache is not None:
+            key_material = "|".join(
+                (
+                    self.config.tenant_slug or "",
+                    candidate_id or "",
+                    mode,
+                    content_type,
+                    title or "",
+                    json.dumps(metadata or {}, sort_keys=True),
+                    str(candidate_content),
+                    json.dumps(options or {}, sort_keys=True),
+                )
+            )
+            cache_key = hashlib.blake2b(key_material.encode(), digest_size=16).digest()
+            with self._validate_cache_lock:
+                hit = self._validate_cache.get(cache_key)
+                if hit is not None:
+                    self._validate_cache.move_to_end(cache_key)
+                    return hit
+
+        if request_id is None:
+            request_id = self._default_request_id
+
+        # Engine-direct requires tenant_slug; MCP must not include it.
+        extra: dict[str, Any] = {}
+        if self.config.mode == "engine":
+            if not (self.config.tenant_slug or "").strip():
+                raise ValueError("tenant_slug is required for engine-direct client")
+            tenant = _validated_tenant(self.config.tenant_slug)
+            extra = {"tenant_slug": tenant, "actor": _SDK_ACTOR}
+
+        payload = _validate_payload(
+            candidate_content=candidate_content,
+            content_type=content_type,
+            mode=mode,
+            title=title,
+            metadata=metadata,
+            options=options,
+            request_id=request_id,
+            candidate_id=candidate_id,
+            extra=extra,
+        )
+        body = json.dumps(payload, separators=(",", ":"))
+        # Copy: _auth_headers may hand back a shared read-only mapping.
+        headers = {**self._auth_headers(require_auth=True, request_id=request_id), **_JSON_HEADERS}
+
+        # Retrying a POST is only safe when the engine can dedupe it. With a
+        # candidate_id we can derive a stable Idempotency-Key and recover from
+        # transient 429/5xx without the caller re-posting the payload.
+        if candidate_id:
+            content_digest = hashlib.sha256(str(candidate_content).encode()).hexdigest()
+            key_material = f"{extra.get('tenant_slug', '')}|{candidate_id}|{content_digest}"
+            headers["Idempotency-Key"] = hashlib.sha256(key_material.encode()).hexdigest()
+            resp = self._post_validate_with_retry(body, headers)
+        else:
+            resp = self._client.post(
+                _VALIDATE_URL,
+                content=body,
+                timeout=self._validate_timeout,
+                headers=headers,
+            )
+            self._raise_for_status(resp)
+
+        if cache_key is not None and self._validate_cache is not None:
+            with self._validate_cache_lock:
+                self._validate_cache[cache_key] = resp
+                if len(self._validate_cache) > self._validate_cache_size:
+                    self._validate_cache.popitem(last=False)
+        return resp
+
+    @_retry_post_idempotent()
+    def _post_validate_with_retry(self, body: str, headers: dict[str, str]) -> httpx.Response:
+        resp = self._client.post(
+            _VALIDATE_URL,
+            content=body,
+            timeout=self._validate_timeout,
+            headers=headers,
+        )
+        if _is_transient_response(resp):
+            return resp
+        self._raise_for_status(resp)
+        return resp
+
+    def validate(
+        self,
+        *,
+        candidate_content: str | None = None,
+        content_type: str = "text/markdown",
+        mode: str = "audit",
+        title: str | None = None,
+        metadata: dict[str, str] | None = None,
+        options: dict[str, Any] | None = None,
+        request_id: str | None = None,
+        # legacy args (deprecated)
+        content: str | None = None,
+        candidate_text: str | None = None,
+        candidate_id: str | None = None,
+        candidate_title: str | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> ValidateResponse:
+        """POST /v1/validate (contract-native).
+
+        In MCP mode, tenant is derived by MCP from the JWT.
+        In engine-direct mode, tenant is required.
+        """
+        resp = self._post_validate(
+            candidate_content=candidate_content,
+            content_type=content_type,
+            mode=mode,
+            title=title,
+            metadata=metadata,
+            options=options,
+            request_id=request_id,
+            content=content,
+            candidate_text=candidate_text,
+            candidate_id=candidate_id,
+            candidate_title=candidate_title,
+            context=context,
+        )
+        if not self._strict_parse:
+            return _parse_validate_lenient(resp.content)
+        return ValidateResponse.model_validate_json(resp.content)
+
+    def validate_batch(
+        self,
+        candidates: list[dict[str, Any]],
+        *,
+        mode: str = "audit",
+        concurrency: int = 8,
+    ) -> list[ValidateResponse]:
+        """POST /v1/validate:batch - validate many candidates in one round trip.
+
+        Each candidate is a dict of :meth:`validate` keyword arguments (e.g.
+        ``{"candidate_content": "..."}``); ``mode`` is the default for items
+        that don't set their own. Batching amortizes auth, serialization and
+        dispatch across N logical requests. Servers that don't expose the
+        endpoint yet (404) are handled transparently by fanning the individual
+        validate calls out across a small thread pool - httpx.Client is
+        thread-safe, so the pool shares this client's connections.
+        """
+        if not candidates:
+            return []
+
+        extra: dict[str, Any] = {}
+        if self.config.mode == "engine":
+            if not (self.config.tenant_slug or "").strip():
+                raise ValueError("tenant_slug is required for engine-direct client")
+            tenant = _validated_tenant(self.config.tenant_slug)
+            extra = {"tenant_slug": tenant, "actor": _SDK_ACTOR}
+
+        payload: dict[str, Any] = {
+            "requests": [_validate_payload(**{"mode": mode, **cand}) for cand in candidates],
+            **extra,
+        }
+        headers = {**self._auth_headers(), **_JSON_HEADERS}
+        resp = self._client.post(
+            _VALIDATE_BATCH_URL,
+            content=json.dumps(payload, separators=(",", ":")),
+            timeout=self._validate_timeout,
+            headers=headers,
+        )
+        if resp.status_code == 404:
+            # Endpoint not deployed: same results, N round trips in parallel.
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(candidates))) as pool:
+                return list(
+                    pool.map(lambda cand: self.validate(**{"mode": mode, **cand}), candidates)
+                )
+        self._raise_for_status(resp)
+        results = _loads(resp.content).get("results") or []
+        if not self._strict_parse:
+            return [_construct_validate_response(r) for r in results]
+        return [ValidateResponse.model_validate(r) for r in results]
+
+    def raw_validate(self, **kwargs: Any) -> dict[str, Any]:
+        """Like :meth:`validate` but returns the parsed JSON dict as-is.
+
+        Skips pydantic model construction; intended for adapters (e.g. the
+        MCP server) that immediately reshape the response into plain dicts.
+        """
+        resp = self._post_validate(**kwargs)
+        return _loads(resp.content)
+
+    def clear_validate_cache(self) -> None:
+        """Drop all entries from the in-memory validate response cache."""
+        if self._validate_cache is not None:
+            with self._validate_cache_lock:
+                self._validate_cache.clear()
+
+    def raw_get_run(self, run_id: str) -> dict[str, Any]:
+        """GET /v1/runs/{run_id} returning the parsed JSON dict as-is.
+
+        Bypasses both model construction and the on-disk response cache.
+        """
+        return _loads(self._get(_run_url(run_id)).content)
+
+    def raw_list_chunks(self, run_id: str) -> dict[str, Any]:
+        """GET /v1/runs/{run_id}/chunks returning the parsed JSON dict as-is.
+
+        Bypasses both model construction and the on-disk response cache.
+        """
+        return _loads(self._get(_chunks_url(run_id)).content)
+
+    def _cache_key(self, path: str) -> str:
+        # The on-disk store may be shared by clients pointed at different
+        # deployments (the default file lives under ~/.cache); prefix the
+        # path with base_url so staging and prod entries for the same run_id
+        # can't serve each other's bodies.
+        return f"{self.config.base_url}{path}"
+
+    def get_run(self, run_id: str) -> RunStateResponse:
+        key = self._cache_key(_run_path(run_id))
+        if self._cache is not None:
+            raw = self._cache.get(key)
+            if raw is not None:
+                return self._parse_run_state(raw)
+        resp = self._get(_run_url(run_id))
+        run = self._parse_run_state(resp.content)
+        if self._cache is not None and str(run.pipeline_status).upper() != "RUNNING":
+            self._cache.set(key, resp.content)
+        return run
+
+    def _parse_run_state(self, raw: bytes) -> RunStateResponse:
+        if not self._strict_parse:
+            return _parse_run_state_lenient(raw)
+        return _parse_response(RunStateResponse, raw)
+
+    def _parse_chunks(self, raw: bytes) -> list[ChunkResult]:
+        if not self._strict_parse:
+            return _parse_chunks_lenient(raw)
+        return _parse_response(ChunkResultsResponse, raw).chunks
+
+    def list_chunks(self, run_id: str) -> list[ChunkResult]:
+        key = self._cache_key(_chunks_path(run_id))
+        if self._cache is not None:
+            raw = self._cache.get(key)
+            if raw is not None:
+                return self._parse_chunks(raw)
+        resp = self._get(_chunks_url(run_id))
+        chunks = self._parse_chunks(resp.content)
+        # Chunk results are only immutable once the run is terminal; a cached
+        # run-state entry (written only for terminal runs) is that signal.
+        if self._cache is not None and self._cache_key(_run_path(run_id)) in self._cache:
+            self._cache.set(key, resp.content)
+        return chunks
+
+    def iter_chunks(self, run_id: str) -> Iterator[ChunkResult]:
+        """Stream chunk results for a run, yielding each ChunkResult as it arrives.
+
+        With the optional ijson package installed (pip install
+        dorc-client[fast]) the response body is parsed incrementally, so peak
+        memory stays flat regardless of chunk count and callers can stop
+        early. Without ijson the body is buffered and parsed whole, matching
+        list_chunks. Streaming requests are not retried.
+        """
+        with self._client.stream(
+            "GET",
+            _chunks_url(run_id),
+            timeout=self._timeout,
+            headers=self._auth_headers(),
+        ) as resp:
+            if resp.status_code >= 300:
+                resp.read()
+                self._raise_for_status(resp)
+            if ijson is not None:
+                for obj in ijson.items(_ByteStreamReader(resp.iter_bytes()), "chunks.item"):
+                    if self._strict_parse:
+                        yield ChunkResult.model_validate(obj)
+                    else:
+                        yield _construct_chunk(obj)
+                return
+            resp.read()
+            yield from self._parse_chunks(resp.content)
+
+    def _wait_on_events(self, run_id: str, deadline: float) -> RunStateResponse | None:
+        """Follow /v1/runs/{run_id}/events (SSE) until the run leaves RUNNING.
+
+        Returns None when the endpoint is unavailable or the stream drops, in
+        which case the caller falls back to polling. A 404 marks events as
+        unsupported for this client so later waits skip the probe.
+        """
+        try:
+            with self._client.stream(
+                "GET",
+                f"{_run_path(run_id)}/events",
+                timeout=httpx.Timeout(5.0, read=max(deadline - time.time(), 1.0)),
+                headers=self._auth_headers(),
+            ) as resp:
+                if resp.status_code == 404:
+                    self._events_supported = False
+                    return None
+                if resp.status_code >= 300:
+                    return None
+                for line in resp.iter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    try:
+                        event = json.loads(line[5:].strip())
+                    except ValueError:
+                        continue
+                    if str(event.get("pipeline_status", "RUNNING")).upper() != "RUNNING":
+                        return self.get_run(run_id)
+                    if time.time() >= deadline:
+                        return None
+        except httpx.HTTPError:
+            return None
+        return None
+
+    def wait_for_completion(
+        self,
+        run_id: str,
+        *,
+        poll_interval_s: float = 2.0,
+        max_poll_interval_s: float = 15.0,
+        timeout_s: float = 60.0,
+        use_events: bool = True,
+    ) -> RunStateResponse:
+        """Wait until /v1/runs/{run_id} leaves pipeline_status RUNNING (best-effort).
+
+        Prefers the server's SSE events endpoint when available (no polling at
+        all); otherwise polls with exponential backoff capped at
+        ``max_poll_interval_s`` plus +/-20% jitter, so short runs are noticed
+        quickly while long runs don't hammer the engine at a fixed 2s cadence.
+
+        Args:
+            run_id: Run identifier
+            poll_interval_s: Initial polling interval in seconds
+            max_poll_interval_s: Backoff cap for the polling interval
+            timeout_s: Timeout in seconds
+            use_events: Try the SSE events endpoint before polling
+
+        Note: In MCP mode, tenant is extracted from the Bearer token by MCP.
+        Note: engine currently exposes `pipeline_status` not contract `status`.
+        """
+        deadline = time.time() + timeout_s
+        if use_events and self._events_supported is not False:
+            run = self._wait_on_events(run_id, deadline)
+            if run is not None:
+                return run
+
+        attempt = 0
+        while True:
+            r = self.get_run(run_id)
+            if str(r.pipeline_status).upper() != "RUNNING":
+                return r
+            if time.time() >= deadline:
+                raise TimeoutError(f"timeout waiting for run {run_id}")
+            interval = min(poll_interval_s * 1.5**attempt, max_poll_interval_s)
+            interval *= random.uniform(0.8, 1.2)
+            time.sleep(min(interval, max(deadline - time.time(), 0.0)))
+            attempt += 1
+
+
+
+
+_default_client: DorcClient | None = None
+
+
+def get_default_client() -> DorcClient:
+    """Return a process-wide DorcClient built from environment config.
+
+    Constructing a DorcClient per call throws away its connection pool;
+    callers doing one-off requests (CLIs, examples) should prefer this
+    shared instance so TLS handshakes are paid once per process.
+    """
+    global _default_client
+    if _default_client is None:
+        _default_client = DorcClient()
+    return _default_client
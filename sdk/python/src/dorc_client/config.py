@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Literal
@@ -26,7 +27,15 @@ class Config:
     api_key: str | None = None
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def from_env(cls) -> Config:
+        """Build a Config from environment variables.
+
+        The result is cached for the life of the process (Config is frozen),
+        so repeated client construction skips the env parsing. Call
+        ``Config.from_env.cache_clear()`` after changing environment
+        variables to pick up new values.
+        """
         # MCP mode (primary, contract-compliant)
         mcp_url = (os.getenv("DORC_MCP_URL") or "").strip().rstrip("/")
         if mcp_url:
@@ -131,3 +131,26 @@ class ChunkResultsResponse(BaseModel):
     chunks: list[ChunkResult]
 
 
+# Materialize pydantic-core validators/serializers at import time so any
+# deferred schema build is paid once at startup instead of on the first
+# request (noticeable in cold-start CLI paths like mcp/server.py).
+for _model in (
+    Candidate,
+    ChunkingOptions,
+    ModelsOptions,
+    ValidateOptions,
+    ValidateRequest,
+    EvidenceItem,
+    ChunkResult,
+    ContentSummary,
+    Counts,
+    Links,
+    ValidateResponse,
+    RunStateResponse,
+    ChunkResultsResponse,
+):
+    _model.model_rebuild()
+    _ = _model.__pydantic_validator__, _model.__pydantic_serializer__
+del _model
+
+
@@ -0,0 +1,88 @@
+"""msgspec mirrors of the response models for the raw/hot parsing path.
+
+These decode straight from response bytes into compact ``msgspec.Struct``
+instances in one C pass - typically several times faster and ~3x smaller
+per object than the pydantic models, which matters for chunk-heavy runs.
+The pydantic models in models.py remain the public typed API; unlike them,
+these drop unknown fields instead of keeping extras.
+
+Requires the optional ``msgspec`` package (pip install dorc-client[fast]);
+importing this module without it raises ImportError.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import msgspec
+
+
+class EvidenceItem(msgspec.Struct, gc=False):
+    source: str | None = None
+    excerpt: str | None = None
+    note: str | None = None
+
+
+class ChunkResult(msgspec.Struct, gc=False):
+    chunk_id: str
+    index: int
+    status: str
+    model_used: str | None = None
+    finding_count: int = 0
+    message: str = ""
+    evidence: list[EvidenceItem] = []
+    details: dict[str, Any] | None = None
+
+
+class ContentSummary(msgspec.Struct, gc=False, rename={"pass_": "pass"}):
+    pass_: int = 0
+    fail: int = 0
+    warn: int = 0
+    error: int = 0
+
+
+class Counts(
+    msgspec.Struct,
+    gc=False,
+    rename={"pass_": "PASS", "fail": "FAIL", "warn": "WARN", "error": "ERROR"},
+):
+    pass_: int = 0
+    fail: int = 0
+    warn: int = 0
+    error: int = 0
+    total_chunks: int = 0
+
+
+class Links(msgspec.Struct, gc=False):
+    run: str
+    chunks: str
+
+
+class ValidateResponse(msgspec.Struct, gc=False):
+    request_id: str
+    run_id: str
+    status: str
+    result: str
+    counts: Counts
+    links: Links
+
+
+class RunStateResponse(msgspec.Struct, gc=False):
+    run_id: str
+    tenant_slug: str
+    pipeline_status: str
+    content_summary: ContentSummary
+    inserted_at: str
+    meta: dict[str, Any] = {}
+
+
+class ChunkResultsResponse(msgspec.Struct, gc=False):
+    run_id: str
+    tenant_slug: str
+    chunks: list[ChunkResult] = []
+
+
+# Shared decoders; building a Decoder once avoids per-call setup cost.
+validate_response_decoder = msgspec.json.Decoder(ValidateResponse)
+run_state_decoder = msgspec.json.Decoder(RunStateResponse)
+chunk_results_decoder = msgspec.json.Decoder(ChunkResultsResponse)
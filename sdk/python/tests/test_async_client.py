@@ -0,0 +1,92 @@
+"""Tests for the async dorc-client SDK using mocked HTTP responses."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from dorc_client import AsyncDorcClient
+from dorc_client.models import ValidateResponse
+
+BASE_URL = "https://test-mcp.run.app"
+
+
+def _validate_response(request_id: str = "req-test-123") -> dict:
+    return {
+        "request_id": request_id,
+        "run_id": "run-test-123",
+        "status": "COMPLETE",
+        "result": "PASS",
+        "counts": {"PASS": 1, "FAIL": 0, "WARN": 0, "ERROR": 0, "total_chunks": 1},
+        "links": {"run": "/v1/runs/run-test-123", "chunks": "/v1/runs/run-test-123/chunks"},
+    }
+
+
+def test_async_validate_sends_authorization_header(httpx_mock):
+    """Test async validate sends Authorization: Bearer <token> header."""
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{BASE_URL}/v1/validate",
+        match_headers={"Authorization": "Bearer test-jwt-token"},
+        json=_validate_response(),
+    )
+
+    async def run():
+        async with AsyncDorcClient.for_mcp(BASE_URL, token="test-jwt-token") as client:
+            return await client.validate(candidate_content="Test content")
+
+    response = asyncio.run(run())
+    assert isinstance(response, ValidateResponse)
+    assert response.run_id == "run-test-123"
+
+
+def test_validate_many_runs_concurrently(httpx_mock):
+    """Test validate_many fans out requests and preserves input order."""
+    seen: list[str] = []
+
+    def echo_candidate(request: httpx.Request) -> httpx.Response:
+        content = json.loads(request.read())["candidate"]["content"]
+        seen.append(content)
+        return httpx.Response(status_code=200, json=_validate_response(request_id=content))
+
+    httpx_mock.add_callback(echo_candidate, is_reusable=True)
+
+    items = [{"candidate_content": f"doc-{i}"} for i in range(5)]
+
+    async def run():
+        async with AsyncDorcClient.for_mcp(BASE_URL, token="test-jwt-token") as client:
+            return await client.validate_many(items, concurrency=3)
+
+    responses = asyncio.run(run())
+    assert [r.request_id for r in responses] == [f"doc-{i}" for i in range(5)]
+    assert sorted(seen) == sorted(f"doc-{i}" for i in range(5))
+
+
+def test_async_validate_legacy_args_warn_and_still_map(httpx_mock):
+    """Deprecated candidate_text= still maps onto the wire payload."""
+    httpx_mock.add_response(
+        method="POST", url=f"{BASE_URL}/v1/validate", json=_validate_response()
+    )
+
+    async def run():
+        async with AsyncDorcClient.for_mcp(BASE_URL, token="t") as client:
+            return await client.validate(candidate_text="Legacy content")
+
+    with pytest.warns(DeprecationWarning, match="candidate_content") as records:
+        response = asyncio.run(run())
+
+    # stacklevel points the warning at the deprecated call site, not the SDK.
+    assert records[0].filename == __file__
+    assert response.run_id == "run-test-123"
+    payload = json.loads(httpx_mock.get_request().read())
+    assert payload["candidate"]["content"] == "Legacy content"
+
+
+def test_validate_many_rejects_bad_concurrency():
+    async def run():
+        async with AsyncDorcClient.for_mcp(BASE_URL, token="t") as client:
+            await client.validate_many([], concurrency=0)
+
+    with pytest.raises(ValueError, match="concurrency"):
+        asyncio.run(run())
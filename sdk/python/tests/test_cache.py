@@ -0,0 +1,87 @@
+"""Tests for the on-disk response cache for terminal runs."""
+
+import pytest
+
+from dorc_client import Config, DorcClient
+
+BASE_URL = "https://test-mcp.run.app"
+
+RUN_RESPONSE = {
+    "run_id": "run-test-123",
+    "tenant_slug": "test-tenant",
+    "pipeline_status": "COMPLETE",
+    "content_summary": {"pass": 1, "fail": 0, "warn": 0, "error": 0},
+    "inserted_at": "2024-01-15T10:30:00Z",
+    "meta": {},
+}
+
+CHUNKS_RESPONSE = {
+    "run_id": "run-test-123",
+    "tenant_slug": "test-tenant",
+    "chunks": [
+        {
+            "chunk_id": "ch-0-abc",
+            "index": 0,
+            "status": "PASS",
+            "finding_count": 0,
+            "message": "No contradictions",
+            "evidence": [],
+        },
+    ],
+}
+
+
+@pytest.fixture
+def config():
+    return Config(base_url=BASE_URL, mode="mcp", token="test-jwt")
+
+
+def test_get_run_terminal_response_is_cached(tmp_path, config, httpx_mock):
+    """A COMPLETE run is served from the cache on the second call."""
+    httpx_mock.add_response(
+        method="GET", url=f"{BASE_URL}/v1/runs/run-test-123", json=RUN_RESPONSE
+    )
+
+    with DorcClient(config=config, cache=tmp_path / "http.sqlite") as client:
+        first = client.get_run("run-test-123")
+        second = client.get_run("run-test-123")
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert first == second
+    assert second.pipeline_status == "COMPLETE"
+
+
+def test_list_chunks_cached_only_for_known_terminal_run(tmp_path, config, httpx_mock):
+    """Chunks hit the network until the run is known terminal, then cache."""
+    chunks_url = f"{BASE_URL}/v1/runs/run-test-123/chunks"
+    httpx_mock.add_response(method="GET", url=chunks_url, json=CHUNKS_RESPONSE, is_reusable=True)
+    httpx_mock.add_response(
+        method="GET", url=f"{BASE_URL}/v1/runs/run-test-123", json=RUN_RESPONSE
+    )
+
+    with DorcClient(config=config, cache=tmp_path / "http.sqlite") as client:
+        # Run not yet seen as terminal: chunks are fetched each time.
+        client.list_chunks("run-test-123")
+        client.list_chunks("run-test-123")
+        assert len(httpx_mock.get_requests(url=chunks_url)) == 2
+
+        # After the terminal run state is cached, chunks become cacheable.
+        client.get_run("run-test-123")
+        client.list_chunks("run-test-123")
+        client.list_chunks("run-test-123")
+        assert len(httpx_mock.get_requests(url=chunks_url)) == 3
+
+
+def test_cache_disabled_by_default(config, httpx_mock):
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{BASE_URL}/v1/runs/run-test-123",
+        json=RUN_RESPONSE,
+        is_reusable=True,
+    )
+
+    with DorcClient(config=config) as client:
+        client.get_run("run-test-123")
+        client.get_run("run-test-123")
+
+    assert len(httpx_mock.get_requests()) == 2
@@ -1,231 +1,446 @@
-"""Tests for dorc-client SDK using mocked HTTP responses."""
-
-import os
-from unittest.mock import patch
-
-import httpx
-import pytest
-
-from dorc_client import Config, DorcClient
-from dorc_client.errors import DorcError
-from dorc_client.models import ChunkResult, RunStateResponse, ValidateResponse
-
-
-@pytest.fixture
-def config():
-    """Create a test MCP configuration."""
-    return Config(
-        base_url="https://test-mcp.run.app",
-        mode="mcp",
-        token="test-jwt-token",
-    )
-
-
-@pytest.fixture
-def client(config):
-    """Create a test MCP client."""
-    c = DorcClient(config=config)
-    return c
-
-
-def _with_transport(client: DorcClient, handler):
-    client._client.close()
-    client._client = httpx.Client(  # type: ignore[attr-defined]
-        base_url=client.config.base_url,
-        transport=httpx.MockTransport(handler),
-    )
-
-
-def test_health_success(client):
-    """Test successful health check."""
-    def handler(request: httpx.Request) -> httpx.Response:
-        assert request.method == "GET"
-        assert str(request.url) == "https://test-mcp.run.app/health"
-        return httpx.Response(
-            status_code=200,
-            json={"status": "ok", "service": "dorc-mcp", "version": "0.1.0"},
-        )
-
-    _with_transport(client, handler)
-    result = client.health()
-    assert result["status"] == "ok"
-
-
-def test_validate_cce_success(client):
-    """Test successful validate request."""
-    mock_response = {
-        "request_id": "req-test-123",
-        "run_id": "run-test-123",
-        "status": "COMPLETE",
-        "result": "PASS",
-        "counts": {"PASS": 1, "FAIL": 0, "WARN": 0, "ERROR": 0, "total_chunks": 1},
-        "links": {"run": "/v1/runs/run-test-123", "chunks": "/v1/runs/run-test-123/chunks"},
-    }
-
-    def handler(request: httpx.Request) -> httpx.Response:
-        assert request.method == "POST"
-        assert str(request.url) == "https://test-mcp.run.app/v1/validate"
-        assert request.headers.get("Authorization") == "Bearer test-jwt-token"
-        return httpx.Response(status_code=200, json=mock_response)
-
-    _with_transport(client, handler)
-    response = client.validate(candidate_content="Test content")
-    
-    assert isinstance(response, ValidateResponse)
-    assert response.run_id == "run-test-123"
-    assert response.status == "COMPLETE"
-
-
-def test_get_run_success(client):
-    """Test successful get_run request."""
-    mock_response = {
-        "run_id": "run-test-123",
-        "tenant_slug": "test-tenant",
-        "pipeline_status": "COMPLETE",
-        "content_summary": {
-            "pass": 2,
-            "fail": 0,
-            "warn": 0,
-            "error": 0,
-        },
-        "inserted_at": "2024-01-15T10:30:00Z",
-        "meta": {},
-    }
-
-    def handler(request: httpx.Request) -> httpx.Response:
-        assert request.method == "GET"
-        assert str(request.url) == "https://test-mcp.run.app/v1/runs/run-test-123"
-        assert request.headers.get("Authorization") == "Bearer test-jwt-token"
-        return httpx.Response(status_code=200, json=mock_response)
-
-    _with_transport(client, handler)
-    response = client.get_run(run_id="run-test-123")
-    
-    assert isinstance(response, RunStateResponse)
-    assert response.run_id == "run-test-123"
-    assert response.pipeline_status == "COMPLETE"
-
-
-def test_get_run_not_found(client):
-    """Test get_run with 404 error."""
-    def handler(request: httpx.Request) -> httpx.Response:
-        assert request.method == "GET"
-        assert str(request.url) == "https://test-mcp.run.app/v1/runs/nonexistent"
-        assert request.headers.get("Authorization") == "Bearer test-jwt-token"
-        return httpx.Response(
-            status_code=404,
-            json={"error": {"code": "NOT_FOUND", "message": "run not found"}},
-        )
-
-    _with_transport(client, handler)
-    
-    with pytest.raises(DorcError):
-        client.get_run(run_id="nonexistent")
-
-
-def test_list_chunks_success(client):
-    """Test successful list_chunks request."""
-    mock_response = {
-        "run_id": "run-test-123",
-        "tenant_slug": "test-tenant",
-        "chunks": [
-            {
-                "chunk_id": "ch-0-abc",
-                "index": 0,
-                "status": "PASS",
-                "model_used": "gemini-2.5-pro",
-                "finding_count": 0,
-                "message": "No contradictions",
-                "evidence": [],
-                "details": None,
-            },
-            {
-                "chunk_id": "ch-1-def",
-                "index": 1,
-                "status": "FAIL",
-                "model_used": "gemini-2.5-pro",
-                "finding_count": 2,
-                "message": "Found contradictions",
-                "evidence": [
-                    {
-                        "source": "canon_v2/section.md",
-                        "excerpt": "Existing content...",
-                        "note": "Contradiction",
-                    }
-                ],
-                "details": {"confidence": 0.85},
-            },
-        ],
-    }
-
-    def handler(request: httpx.Request) -> httpx.Response:
-        assert request.method == "GET"
-        assert str(request.url) == "https://test-mcp.run.app/v1/runs/run-test-123/chunks"
-        assert request.headers.get("Authorization") == "Bearer test-jwt-token"
-        return httpx.Response(status_code=200, json=mock_response)
-
-    _with_transport(client, handler)
-    chunks = client.list_chunks(run_id="run-test-123")
-    
-    assert len(chunks) == 2
-    assert isinstance(chunks[0], ChunkResult)
-    assert chunks[0].status == "PASS"
-    assert chunks[1].status == "FAIL"
-    assert chunks[1].finding_count == 2
-
-
-def test_request_id_header_sent(config):
-    """Ensure X-Request-Id is sent when provided."""
-    c = DorcClient(config=config, request_id="req-abc123")
-
-    mock_response = {
-        "request_id": "req-abc123",
-        "run_id": "run-test-123",
-        "status": "COMPLETE",
-        "result": "PASS",
-        "counts": {"PASS": 1, "FAIL": 0, "WARN": 0, "ERROR": 0, "total_chunks": 1},
-        "links": {"run": "/v1/runs/run-test-123", "chunks": "/v1/runs/run-test-123/chunks"},
-    }
-
-    def handler(request: httpx.Request) -> httpx.Response:
-        assert request.headers.get("X-Request-Id") == "req-abc123"
-        return httpx.Response(status_code=200, json=mock_response)
-
-    _with_transport(c, handler)
-    resp = c.validate(
-        candidate_content="hello",
-        candidate_id="c-1",
-        candidate_title="t",
-    )
-    assert resp.request_id == "req-abc123"
-
-
-def test_config_from_env_mcp_mode():
-    """Test Config.from_env loads MCP mode when DORC_MCP_URL is set."""
-    with patch.dict(
-        os.environ,
-        {
-            "DORC_MCP_URL": "https://test-mcp.run.app",
-            "DORC_JWT": "test-jwt-token",
-        },
-        clear=True,
-    ):
-        config = Config.from_env()
-        assert config.base_url == "https://test-mcp.run.app"
-        assert config.mode == "mcp"
-        assert config.token == "test-jwt-token"
-
-
-def test_config_strips_trailing_slash():
-    """Test Config.from_env strips trailing slash from base_url."""
-    with patch.dict(
-        os.environ,
-        {
-            "DORC_MCP_URL": "https://test-mcp.run.app/",
-            "DORC_JWT": "test-jwt",
-        },
-        clear=True,
-    ):
-        config = Config.from_env()
-        assert config.base_url == "https://test-mcp.run.app"
-
+"""Tests for dorc-client SDK using mocked HTTP responses."""
+
+import json
+
+import pytest
+
+from dorc_client import Config, DorcClient
+from dorc_client.errors import DorcError
+from dorc_client.models import ChunkResult, RunStateResponse, ValidateResponse
+
+BASE_URL = "https://test-mcp.run.app"
+
+# Shared mock payloads, built once at module load instead of per test body.
+HEALTH_JSON = {"status": "ok", "service": "dorc-mcp", "version": "0.1.0"}
+
+VALIDATE_JSON = {
+    "request_id": "req-test-123",
+    "run_id": "run-test-123",
+    "status": "COMPLETE",
+    "result": "PASS",
+    "counts": {"PASS": 1, "FAIL": 0, "WARN": 0, "ERROR": 0, "total_chunks": 1},
+    "links": {"run": "/v1/runs/run-test-123", "chunks": "/v1/runs/run-test-123/chunks"},
+}
+
+RUN_JSON = {
+    "run_id": "run-test-123",
+    "tenant_slug": "test-tenant",
+    "pipeline_status": "COMPLETE",
+    "content_summary": {
+        "pass": 2,
+        "fail": 0,
+        "warn": 0,
+        "error": 0,
+    },
+    "inserted_at": "2024-01-15T10:30:00Z",
+    "meta": {},
+}
+
+CHUNKS_JSON = {
+    "run_id": "run-test-123",
+    "tenant_slug": "test-tenant",
+    "chunks": [
+        {
+            "chunk_id": "ch-0-abc",
+            "index": 0,
+            "status": "PASS",
+            "model_used": "gemini-2.5-pro",
+            "finding_count": 0,
+            "message": "No contradictions",
+            "evidence": [],
+            "details": None,
+        },
+        {
+            "chunk_id": "ch-1-def",
+            "index": 1,
+            "status": "FAIL",
+            "model_used": "gemini-2.5-pro",
+            "finding_count": 2,
+            "message": "Found contradictions",
+            "evidence": [
+                {
+                    "source": "canon_v2/section.md",
+                    "excerpt": "Existing content...",
+                    "note": "Contradiction",
+                }
+            ],
+            "details": {"confidence": 0.85},
+        },
+    ],
+}
+
+
+def _validate_payload_json(run_id: str) -> dict:
+    return {
+        "request_id": f"req-{run_id}",
+        "run_id": run_id,
+        "status": "COMPLETE",
+        "result": "PASS",
+        "counts": {"PASS": 1, "FAIL": 0, "WARN": 0, "ERROR": 0, "total_chunks": 1},
+        "links": {"run": f"/v1/runs/{run_id}", "chunks": f"/v1/runs/{run_id}/chunks"},
+    }
+
+
+@pytest.fixture(scope="module")
+def config():
+    """Create a test MCP configuration (immutable, shared across the module)."""
+    return Config(
+        base_url=BASE_URL,
+        mode="mcp",
+        token="test-jwt-token",
+    )
+
+
+@pytest.fixture(scope="module")
+def client(config):
+    """Create a test MCP client once per module; httpx_mock intercepts per test."""
+    c = DorcClient(config=config)
+    yield c
+    c.close()
+
+
+# Everything Config.from_env reads; cleared so ambient developer environment
+# can't leak into the config tests.
+_CONFIG_ENV_VARS = (
+    "DORC_BASE_URL",
+    "DORC_ENGINE_URL",
+    "DORC_MCP_URL",
+    "DORC_TENANT_SLUG",
+    "DORC_API_KEY",
+    "DORC_JWT",
+    "DORC_TOKEN",
+)
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """monkeypatch with all DORC_* config variables removed."""
+    for var in _CONFIG_ENV_VARS:
+        monkeypatch.delenv(var, raising=False)
+    return monkeypatch
+
+
+@pytest.fixture(autouse=True)
+def _reset_client_state(client):
+    """Reset memoized probe state on the shared client between tests."""
+    yield
+    client._events_supported = None
+    client._health_path = None
+
+
+def test_health_success(client, httpx_mock):
+    """Test successful health check."""
+    httpx_mock.add_response(method="GET", url=f"{BASE_URL}/health", json=HEALTH_JSON)
+    result = client.health()
+    assert result["status"] == "ok"
+
+
+def test_probe_health_true_when_either_endpoint_healthy(client, httpx_mock):
+    """probe_health returns True when one of the two endpoints is 2xx."""
+    httpx_mock.add_response(url=f"{BASE_URL}/healthz", status_code=503, json={"status": "down"})
+    httpx_mock.add_response(url=f"{BASE_URL}/health", json={"status": "ok"})
+    assert client.probe_health() is True
+
+
+def test_probe_health_false_when_both_endpoints_down(client, httpx_mock):
+    httpx_mock.add_response(url=f"{BASE_URL}/healthz", status_code=503, json={"status": "down"})
+    httpx_mock.add_response(url=f"{BASE_URL}/health", status_code=503, json={"status": "down"})
+    assert client.probe_health() is False
+
+
+def test_validate_cce_success(client, httpx_mock):
+    """Test successful validate request."""
+    httpx_mock.add_response(method="POST", url=f"{BASE_URL}/v1/validate", json=VALIDATE_JSON)
+
+    response = client.validate(candidate_content="Test content")
+
+    assert isinstance(response, ValidateResponse)
+    assert response.run_id == "run-test-123"
+    assert response.status == "COMPLETE"
+    request = httpx_mock.get_request()
+    assert request.headers.get("Authorization") == "Bearer test-jwt-token"
+
+
+def test_validate_lenient_parse_maps_aliased_counts(config, httpx_mock):
+    """strict_parse=False still maps PASS/FAIL/... onto the Counts aliases."""
+    mock_response = {
+        **VALIDATE_JSON,
+        "counts": {"PASS": 3, "FAIL": 1, "WARN": 0, "ERROR": 0, "total_chunks": 4},
+    }
+    httpx_mock.add_response(method="POST", url=f"{BASE_URL}/v1/validate", json=mock_response)
+
+    c = DorcClient(config=config, strict_parse=False)
+    response = c.validate(candidate_content="Test content")
+
+    assert isinstance(response, ValidateResponse)
+    assert response.counts.pass_ == 3
+    assert response.counts.fail == 1
+    assert response.counts.total_chunks == 4
+
+
+def test_validate_batch_single_round_trip(client, httpx_mock):
+    """validate_batch posts one request to /v1/validate:batch."""
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{BASE_URL}/v1/validate:batch",
+        json={"results": [_validate_payload_json("run-1"), _validate_payload_json("run-2")]},
+    )
+
+    results = client.validate_batch(
+        [{"candidate_content": "one"}, {"candidate_content": "two"}]
+    )
+
+    requests = httpx_mock.get_requests()
+    assert len(requests) == 1
+    body = json.loads(requests[0].read())
+    assert len(body["requests"]) == 2
+    assert body["requests"][0]["candidate"]["content"] == "one"
+    assert [r.run_id for r in results] == ["run-1", "run-2"]
+
+
+def test_validate_batch_falls_back_to_fan_out_on_404(client, httpx_mock):
+    """A 404 from the batch endpoint falls back to per-candidate validate calls."""
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{BASE_URL}/v1/validate:batch",
+        status_code=404,
+        json={"error": {"code": "NOT_FOUND"}},
+    )
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{BASE_URL}/v1/validate",
+        json=_validate_payload_json("run-1"),
+        is_reusable=True,
+    )
+
+    results = client.validate_batch(
+        [{"candidate_content": "one"}, {"candidate_content": "two"}]
+    )
+
+    paths = [r.url.path for r in httpx_mock.get_requests()]
+    assert paths.count("/v1/validate") == 2
+    assert all(r.run_id == "run-1" for r in results)
+
+
+def _check_run_state(response):
+    assert isinstance(response, RunStateResponse)
+    assert response.run_id == "run-test-123"
+    assert response.pipeline_status == "COMPLETE"
+
+
+def _check_chunks(chunks):
+    assert len(chunks) == 2
+    assert isinstance(chunks[0], ChunkResult)
+    assert chunks[0].status == "PASS"
+    assert chunks[1].status == "FAIL"
+    assert chunks[1].finding_count == 2
+
+
+READ_CASES = [
+    pytest.param(
+        "/v1/runs/run-test-123",
+        RUN_JSON,
+        lambda c: c.get_run(run_id="run-test-123"),
+        _check_run_state,
+        id="get_run",
+    ),
+    pytest.param(
+        "/v1/runs/run-test-123/chunks",
+        CHUNKS_JSON,
+        lambda c: c.list_chunks(run_id="run-test-123"),
+        _check_chunks,
+        id="list_chunks",
+    ),
+]
+
+
+@pytest.mark.parametrize(("path", "payload", "call", "check"), READ_CASES)
+def test_read_endpoint_success(client, httpx_mock, path, payload, call, check):
+    """get_run/list_chunks parse the mocked payload and send Bearer auth."""
+    httpx_mock.add_response(method="GET", url=f"{BASE_URL}{path}", json=payload)
+
+    check(call(client))
+
+    request = httpx_mock.get_request()
+    assert request.headers.get("Authorization") == "Bearer test-jwt-token"
+
+
+def test_wait_for_completion_falls_back_to_polling_without_events(client, httpx_mock):
+    """A 404 from the SSE events endpoint falls through to polling."""
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{BASE_URL}/v1/runs/run-test-123/events",
+        status_code=404,
+        json={"error": {"code": "NOT_FOUND"}},
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{BASE_URL}/v1/runs/run-test-123",
+        json=RUN_JSON,
+        is_reusable=True,
+    )
+
+    run = client.wait_for_completion("run-test-123", timeout_s=5.0)
+    assert run.pipeline_status == "COMPLETE"
+    paths = [r.url.path for r in httpx_mock.get_requests()]
+    assert "/v1/runs/run-test-123/events" in paths
+
+    # 404 is remembered: a second wait goes straight to polling.
+    client.wait_for_completion("run-test-123", timeout_s=5.0)
+    paths = [r.url.path for r in httpx_mock.get_requests()]
+    assert paths.count("/v1/runs/run-test-123/events") == 1
+
+
+def test_get_run_not_found(client, httpx_mock):
+    """Test get_run with 404 error."""
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{BASE_URL}/v1/runs/nonexistent",
+        status_code=404,
+        json={"error": {"code": "NOT_FOUND", "message": "run not found"}},
+    )
+
+    with pytest.raises(DorcError):
+        client.get_run(run_id="nonexistent")
+
+
+def test_iter_chunks_streams_results(client, httpx_mock):
+    """Test iter_chunks yields the same results as list_chunks."""
+    mock_response = {
+        "run_id": "run-test-123",
+        "tenant_slug": "test-tenant",
+        "chunks": [
+            {
+                "chunk_id": f"ch-{i}-abc",
+                "index": i,
+                "status": "PASS",
+                "finding_count": 0,
+                "message": "No contradictions",
+                "evidence": [],
+            }
+            for i in range(3)
+        ],
+    }
+    httpx_mock.add_response(
+        method="GET", url=f"{BASE_URL}/v1/runs/run-test-123/chunks", json=mock_response
+    )
+
+    chunks = list(client.iter_chunks("run-test-123"))
+
+    assert [c.index for c in chunks] == [0, 1, 2]
+    assert all(isinstance(c, ChunkResult) for c in chunks)
+
+
+def test_request_id_header_sent(config, httpx_mock):
+    """Ensure X-Request-Id is sent when provided."""
+    c = DorcClient(config=config, request_id="req-abc123")
+
+    mock_response = {**VALIDATE_JSON, "request_id": "req-abc123"}
+    httpx_mock.add_response(method="POST", url=f"{BASE_URL}/v1/validate", json=mock_response)
+
+    resp = c.validate(
+        candidate_content="hello",
+        candidate_id="c-1",
+        candidate_title="t",
+    )
+    assert resp.request_id == "req-abc123"
+    request = httpx_mock.get_request()
+    assert request.headers.get("X-Request-Id") == "req-abc123"
+
+
+def test_validate_legacy_args_warn_and_still_map(client, httpx_mock):
+    """Deprecated content=/candidate_title= still map onto the wire payload."""
+    httpx_mock.add_response(method="POST", url=f"{BASE_URL}/v1/validate", json=VALIDATE_JSON)
+
+    with pytest.warns(DeprecationWarning, match="candidate_content") as records:
+        response = client.validate(content="Legacy content", candidate_title="Legacy title")
+
+    # stacklevel points the warning at the deprecated call site, not the SDK.
+    assert records[0].filename == __file__
+    assert response.run_id == "run-test-123"
+    payload = json.loads(httpx_mock.get_request().read())
+    assert payload["candidate"]["content"] == "Legacy content"
+    assert payload["candidate"]["title"] == "Legacy title"
+
+
+def test_validate_retries_transient_error_with_idempotency_key(client, httpx_mock):
+    """A transient 503 is retried when candidate_id allows an Idempotency-Key."""
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{BASE_URL}/v1/validate",
+        status_code=503,
+        json={"error": {"code": "UNAVAILABLE"}},
+    )
+    httpx_mock.add_response(method="POST", url=f"{BASE_URL}/v1/validate", json=VALIDATE_JSON)
+
+    response = client.validate(candidate_content="Test content", candidate_id="cce-1")
+
+    assert response.run_id == "run-test-123"
+    requests = httpx_mock.get_requests()
+    assert len(requests) == 2
+    # Same key on both attempts so the engine can dedupe.
+    keys = {r.headers.get("Idempotency-Key") for r in requests}
+    assert len(keys) == 1 and None not in keys
+
+
+def test_validate_does_not_retry_without_candidate_id(client, httpx_mock):
+    """Without candidate_id there is no Idempotency-Key and no retry."""
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{BASE_URL}/v1/validate",
+        status_code=503,
+        json={"error": {"code": "UNAVAILABLE"}},
+    )
+
+    with pytest.raises(DorcError):
+        client.validate(candidate_content="Test content")
+
+    requests = httpx_mock.get_requests()
+    assert len(requests) == 1
+    assert "Idempotency-Key" not in requests[0].headers
+
+
+def test_validate_cache_short_circuits_identical_submissions(config, httpx_mock):
+    """With validate_cache_size set, identical submissions skip the network."""
+    c = DorcClient(config=config, validate_cache_size=8)
+    httpx_mock.add_response(
+        method="POST", url=f"{BASE_URL}/v1/validate", json=VALIDATE_JSON, is_reusable=True
+    )
+
+    first = c.validate(candidate_content="Same content")
+    second = c.validate(candidate_content="Same content")
+    assert len(httpx_mock.get_requests()) == 1
+    assert first.run_id == second.run_id
+
+    c.validate(candidate_content="Different content")
+    assert len(httpx_mock.get_requests()) == 2
+
+    c.clear_validate_cache()
+    c.validate(candidate_content="Same content")
+    assert len(httpx_mock.get_requests()) == 3
+
+
+# (environment, expected Config attributes) for Config.from_env behavior.
+ENV_CASES = [
+    pytest.param(
+        {"DORC_MCP_URL": "https://test-mcp.run.app", "DORC_JWT": "test-jwt-token"},
+        {"base_url": "https://test-mcp.run.app", "mode": "mcp", "token": "test-jwt-token"},
+        id="mcp-mode",
+    ),
+    pytest.param(
+        {"DORC_MCP_URL": "https://test-mcp.run.app/", "DORC_JWT": "test-jwt"},
+        {"base_url": "https://test-mcp.run.app"},
+        id="strips-trailing-slash",
+    ),
+]
+
+
+@pytest.mark.parametrize(("env", "expected"), ENV_CASES)
+def test_config_from_env(clean_env, env, expected):
+    """Config.from_env maps environment variables onto Config attributes."""
+    for var, value in env.items():
+        clean_env.setenv(var, value)
+    Config.from_env.cache_clear()
+    config = Config.from_env()
+    for attr, value in expected.items():
+        assert getattr(config, attr) == value
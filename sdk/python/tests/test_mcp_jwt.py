@@ -1,103 +1,157 @@
 """Tests for dorc-client SDK MCP mode with JWT auth."""
 
-import os
-from unittest.mock import patch
+import json
 
-import httpx
 import pytest
 
 from dorc_client import Config, DorcClient
 from dorc_client.errors import DorcAuthError
 
+BASE_URL = "https://test-mcp.run.app"
+
+VALIDATE_JSON = {
+    "request_id": "req-test-123",
+    "run_id": "run-test-123",
+    "status": "COMPLETE",
+    "result": "PASS",
+    "counts": {"PASS": 1, "FAIL": 0, "WARN": 0, "ERROR": 0, "total_chunks": 1},
+    "links": {"run": "/v1/runs/run-test-123", "chunks": "/v1/runs/run-test-123/chunks"},
+}
+
+RUN_JSON = {
+    "run_id": "run-test-123",
+    "tenant_slug": "test-tenant",
+    "pipeline_status": "COMPLETE",
+    "content_summary": {"pass": 1, "fail": 0, "warn": 0, "error": 0},
+    "inserted_at": "2024-01-15T10:30:00Z",
+    "meta": {},
+}
+
+CHUNKS_JSON = {
+    "run_id": "run-test-123",
+    "tenant_slug": "test-tenant",
+    "chunks": [
+        {
+            "chunk_id": "ch-0-abc",
+            "index": 0,
+            "status": "PASS",
+            "model_used": "gemini-2.5-pro",
+            "finding_count": 0,
+            "message": "No contradictions",
+            "evidence": [],
+            "details": None,
+        },
+    ],
+}
 
-@pytest.fixture
-def mcp_config():
-    """Create a test MCP configuration."""
-    return Config(
-        base_url="https://test-mcp.run.app",
-        mode="mcp",
-        token="test-jwt-token-123",
-    )
 
+@pytest.fixture(scope="module")
+def mcp_client():
+    """One MCP client for the whole module, built via the public factory.
 
-@pytest.fixture
-def mcp_client(mcp_config):
-    """Create a test MCP client."""
-    c = DorcClient(config=mcp_config)
-    return c
+    httpx_mock intercepts its transport in place per test, so no per-test
+    client or config construction happens.
+    """
+    c = DorcClient.for_mcp(BASE_URL, token="test-jwt-token-123")
+    yield c
+    c.close()
 
 
-def _with_transport(client: DorcClient, handler):
-    client._client.close()
-    client._client = httpx.Client(  # type: ignore[attr-defined]
-        base_url=client.config.base_url,
-        transport=httpx.MockTransport(handler),
+def test_health_works_without_jwt(mcp_client, httpx_mock):
+    """Test health endpoint works without JWT (no auth required)."""
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{BASE_URL}/health",
+        json={"status": "ok", "service": "dorc-mcp", "version": "0.1.0"},
     )
 
-
-def test_health_works_without_jwt(mcp_client):
-    """Test health endpoint works without JWT (no auth required)."""
-    def handler(request: httpx.Request) -> httpx.Response:
-        assert request.method == "GET"
-        assert str(request.url) == "https://test-mcp.run.app/health"
-        # Health endpoint doesn't require Authorization header
-        assert "Authorization" not in request.headers
-        return httpx.Response(
-            status_code=200,
-            json={"status": "ok", "service": "dorc-mcp", "version": "0.1.0"},
-        )
-
-    _with_transport(mcp_client, handler)
     result = mcp_client.health()
+
     assert result["status"] == "ok"
     assert result["service"] == "dorc-mcp"
+    # Health endpoint doesn't require Authorization header
+    assert "Authorization" not in httpx_mock.get_request().headers
 
 
-def test_healthz_works_without_jwt(mcp_client):
+def test_healthz_works_without_jwt(mcp_client, httpx_mock):
     """Test healthz endpoint works without JWT (no auth required)."""
-    def handler(request: httpx.Request) -> httpx.Response:
-        assert request.method == "GET"
-        assert str(request.url) == "https://test-mcp.run.app/healthz"
-        # Health endpoint doesn't require Authorization header
-        assert "Authorization" not in request.headers
-        return httpx.Response(
-            status_code=200,
-            json={"status": "ok", "service": "dorc-mcp", "version": "0.1.0"},
-        )
-
-    _with_transport(mcp_client, handler)
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{BASE_URL}/healthz",
+        json={"status": "ok", "service": "dorc-mcp", "version": "0.1.0"},
+    )
+
     result = mcp_client.healthz()
+
     assert result["status"] == "ok"
     assert result["service"] == "dorc-mcp"
+    # Health endpoint doesn't require Authorization header
+    assert "Authorization" not in httpx_mock.get_request().headers
+
+
+# (method, url path, client call, mocked payload) for the endpoints that must
+# all send Authorization: Bearer <jwt>.
+AUTH_CASES = [
+    pytest.param(
+        "POST",
+        "/v1/validate",
+        lambda c: c.validate(candidate_content="# Test CCE\n\nContent here."),
+        VALIDATE_JSON,
+        id="validate",
+    ),
+    pytest.param(
+        "GET",
+        "/v1/runs/run-test-123",
+        lambda c: c.get_run(run_id="run-test-123"),
+        RUN_JSON,
+        id="get_run",
+    ),
+    pytest.param(
+        "GET",
+        "/v1/runs/run-test-123/chunks",
+        lambda c: c.list_chunks(run_id="run-test-123"),
+        CHUNKS_JSON,
+        id="list_chunks",
+    ),
+]
+
+
+@pytest.mark.parametrize(("method", "path", "call", "payload"), AUTH_CASES)
+def test_mcp_sends_authorization_header(mcp_client, httpx_mock, method, path, call, payload):
+    """Every authenticated endpoint sends Authorization: Bearer <jwt>.
+
+    The mock only answers requests carrying the expected header, so a
+    missing/wrong Authorization fails the call itself.
+    """
+    httpx_mock.add_response(
+        method=method,
+        url=f"{BASE_URL}{path}",
+        match_headers={"Authorization": "Bearer test-jwt-token-123"},
+        json=payload,
+    )
+
+    call(mcp_client)
 
 
-def test_validate_cce_sends_authorization_header(mcp_client):
-    """Test validate sends Authorization: Bearer <jwt> header."""
-    mock_response = {
-        "request_id": "req-test-123",
-        "run_id": "run-test-123",
-        "status": "COMPLETE",
-        "result": "PASS",
-        "counts": {"PASS": 1, "FAIL": 0, "WARN": 0, "ERROR": 0, "total_chunks": 1},
-        "links": {"run": "/v1/runs/run-test-123", "chunks": "/v1/runs/run-test-123/chunks"},
-    }
-
-    def handler(request: httpx.Request) -> httpx.Response:
-        assert request.method == "POST"
-        assert str(request.url) == "https://test-mcp.run.app/v1/validate"
-        # Must have Authorization header with Bearer token
-        auth_header = request.headers.get("Authorization")
-        assert auth_header is not None
-        assert auth_header == "Bearer test-jwt-token-123"
-        # Verify payload does NOT include tenant_slug (MCP derives it from JWT)
-        payload = request.read()
-        import json
-        data = json.loads(payload)
-        assert "tenant_slug" not in data
-        assert data["candidate"]["content"] == "# Test CCE\n\nContent here."
-        return httpx.Response(status_code=200, json=mock_response)
-
-    _with_transport(mcp_client, handler)
+def test_validate_cce_payload_excludes_tenant_slug(mcp_client, httpx_mock):
+    """The wire payload is matched exactly - no tenant_slug (MCP derives it from JWT)."""
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{BASE_URL}/v1/validate",
+        match_json={
+            "mode": "audit",
+            "candidate": {
+                "content": "# Test CCE\n\nContent here.",
+                "content_type": "text/markdown",
+            },
+            "options": {
+                "chunking": {"max_chars": 3500, "overlap_chars": 250},
+                "models": {},
+            },
+        },
+        json=VALIDATE_JSON,
+    )
+
     response = mcp_client.validate(candidate_content="# Test CCE\n\nContent here.")
     assert response.run_id == "run-test-123"
 
@@ -105,7 +159,7 @@ def test_validate_cce_sends_authorization_header(mcp_client):
 def test_validate_cce_raises_error_without_jwt():
     """Test validate_cce raises error when JWT is missing."""
     config = Config(
-        base_url="https://test-mcp.run.app",
+        base_url=BASE_URL,
         mode="mcp",
         token=None,  # No JWT
     )
@@ -116,79 +170,26 @@ def test_validate_cce_raises_error_without_jwt():
     assert "Bearer token is required" in str(exc_info.value) or exc_info.value.status_code == 401
 
 
-def test_get_run_sends_authorization_header(mcp_client):
-    """Test get_run sends Authorization: Bearer <jwt> header."""
-    mock_response = {
-        "run_id": "run-test-123",
-        "tenant_slug": "test-tenant",
-        "pipeline_status": "COMPLETE",
-        "content_summary": {"pass": 1, "fail": 0, "warn": 0, "error": 0},
-        "inserted_at": "2024-01-15T10:30:00Z",
-        "meta": {},
-    }
-
-    def handler(request: httpx.Request) -> httpx.Response:
-        assert request.method == "GET"
-        assert str(request.url) == "https://test-mcp.run.app/v1/runs/run-test-123"
-        # Must have Authorization header
-        auth_header = request.headers.get("Authorization")
-        assert auth_header is not None
-        assert auth_header == "Bearer test-jwt-token-123"
-        return httpx.Response(status_code=200, json=mock_response)
-
-    _with_transport(mcp_client, handler)
-    response = mcp_client.get_run(run_id="run-test-123")
-    assert response.run_id == "run-test-123"
+def test_validate_cce_fails_fast_on_expired_jwt():
+    """An expired JWT is rejected locally without an HTTP round-trip."""
+    import base64
+    import time
 
+    def _segment(payload: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
 
-def test_list_chunks_sends_authorization_header(mcp_client):
-    """Test list_chunks sends Authorization: Bearer <jwt> header."""
-    mock_response = {
-        "run_id": "run-test-123",
-        "tenant_slug": "test-tenant",
-        "chunks": [
-            {
-                "chunk_id": "ch-0-abc",
-                "index": 0,
-                "status": "PASS",
-                "model_used": "gemini-2.5-pro",
-                "finding_count": 0,
-                "message": "No contradictions",
-                "evidence": [],
-                "details": None,
-            },
-        ],
-    }
-
-    def handler(request: httpx.Request) -> httpx.Response:
-        assert request.method == "GET"
-        assert str(request.url) == "https://test-mcp.run.app/v1/runs/run-test-123/chunks"
-        # Must have Authorization header
-        auth_header = request.headers.get("Authorization")
-        assert auth_header is not None
-        assert auth_header == "Bearer test-jwt-token-123"
-        return httpx.Response(status_code=200, json=mock_response)
-
-    _with_transport(mcp_client, handler)
-    chunks = mcp_client.list_chunks(run_id="run-test-123")
-    assert len(chunks) == 1
-    assert chunks[0].status == "PASS"
-
-
-def test_config_from_env_mcp_mode():
-    """Test Config.from_env loads MCP mode when DORC_MCP_URL is set."""
-    with patch.dict(
-        os.environ,
-        {
-            "DORC_MCP_URL": "https://test-mcp.run.app",
-            "DORC_JWT": "test-jwt-token",
-        },
-        clear=True,
-    ):
-        config = Config.from_env()
-        assert config.base_url == "https://test-mcp.run.app"
-        assert config.mode == "mcp"
-        assert config.token == "test-jwt-token"
+    expired_jwt = ".".join(
+        [
+            _segment({"alg": "none", "typ": "JWT"}),
+            _segment({"sub": "tester", "exp": int(time.time()) - 3600}),
+            "sig",
+        ]
+    )
+    client = DorcClient(config=Config(base_url=BASE_URL, mode="mcp", token=expired_jwt))
+
+    with pytest.raises(DorcAuthError) as exc_info:
+        client.validate(candidate_content="# Test")
+    assert "expired" in str(exc_info.value)
 
 
 def test_for_mcp_factory():
@@ -200,4 +201,3 @@ def test_for_mcp_factory():
     assert client.config.base_url == "https://test-mcp.run.app"
     assert client.config.mode == "mcp"
     assert client.config.token == "test-jwt"
-
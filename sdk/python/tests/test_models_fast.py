@@ -0,0 +1,63 @@
+"""Tests for the optional msgspec-based fast response models."""
+
+import pytest
+
+pytest.importorskip("msgspec")
+
+from dorc_client import models_fast  # noqa: E402
+
+
+def test_chunk_results_decoder_roundtrip():
+    raw = b"""
+    {
+        "run_id": "run-test-123",
+        "tenant_slug": "test-tenant",
+        "chunks": [
+            {
+                "chunk_id": "ch-0-abc",
+                "index": 0,
+                "status": "FAIL",
+                "finding_count": 2,
+                "message": "Found contradictions",
+                "evidence": [{"source": "canon_v2/section.md", "note": "Contradiction"}],
+                "details": {"confidence": 0.85},
+                "unknown_field": "is dropped"
+            }
+        ]
+    }
+    """
+    parsed = models_fast.chunk_results_decoder.decode(raw)
+    assert isinstance(parsed, models_fast.ChunkResultsResponse)
+    assert parsed.chunks[0].status == "FAIL"
+    assert parsed.chunks[0].evidence[0].source == "canon_v2/section.md"
+
+
+def test_counts_and_summary_aliases():
+    raw = b"""
+    {
+        "request_id": "req-1",
+        "run_id": "run-1",
+        "status": "COMPLETE",
+        "result": "PASS",
+        "counts": {"PASS": 3, "FAIL": 1, "WARN": 0, "ERROR": 0, "total_chunks": 4},
+        "links": {"run": "/v1/runs/run-1", "chunks": "/v1/runs/run-1/chunks"}
+    }
+    """
+    parsed = models_fast.validate_response_decoder.decode(raw)
+    assert parsed.counts.pass_ == 3
+    assert parsed.counts.fail == 1
+    assert parsed.counts.total_chunks == 4
+
+    run_raw = b"""
+    {
+        "run_id": "run-1",
+        "tenant_slug": "test-tenant",
+        "pipeline_status": "COMPLETE",
+        "content_summary": {"pass": 2, "fail": 0, "warn": 1, "error": 0},
+        "inserted_at": "2024-01-15T10:30:00Z"
+    }
+    """
+    run = models_fast.run_state_decoder.decode(run_raw)
+    assert run.content_summary.pass_ == 2
+    assert run.content_summary.warn == 1
+    assert run.meta == {}